@@ -15,10 +15,13 @@
 
 """FastAPI routes for multi-namespace dashboard."""
 
-from typing import Optional, List
+from typing import Optional, List, Union
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
+from ..core.analyzers.storage_analyzer import StorageAnalyzer
 from ..core.services.dashboard_aggregator import DashboardAggregator
 from ..core.models.dashboard_models import (
     ClusterOverview,
@@ -26,7 +29,6 @@ from ..core.models.dashboard_models import (
     GraphData,
     GraphConfig
 )
-from ..core.clients.k8s_client import K8sClient
 from ..core.logging_manager import get_logger
 
 logger = get_logger()
@@ -43,16 +45,42 @@ _cache = {
 }
 CACHE_TTL = 30
 
+# Marks streaming responses as already encoded so GZipMiddleware passes each
+# chunk through instead of buffering it (older Starlette releases compress
+# streams without flushing per chunk)
+STREAM_HEADERS = {"Content-Encoding": "identity"}
+
+# Serializer for summary lists (pydantic-core, no per-item dict walk)
+_SUMMARY_LIST_ADAPTER = TypeAdapter(List[NamespaceSummary])
+
 
 def get_aggregator() -> DashboardAggregator:
     """Get or create dashboard aggregator instance."""
     global _aggregator
     if _aggregator is None:
-        k8s_client = K8sClient()
-        _aggregator = DashboardAggregator.from_k8s_client(k8s_client)
+        # Shares the API server's analyzer, client and watch caches
+        _aggregator = DashboardAggregator(StorageAnalyzer.get_shared(use_cache=True))
     return _aggregator
 
 
+def close_aggregator():
+    """Stop the aggregator's worker threads (called on app shutdown)."""
+    global _aggregator
+    if _aggregator is not None:
+        _aggregator.close()
+        _aggregator = None
+
+
+def _json_response(content: Union[str, bytes]) -> Response:
+    """Wrap already-serialized JSON, skipping FastAPI's response encoding."""
+    return Response(content=content, media_type="application/json")
+
+
+def _summaries_json(summaries: List[NamespaceSummary]) -> bytes:
+    """Serialize namespace summaries, omitting None fields."""
+    return _SUMMARY_LIST_ADAPTER.dump_json(summaries, exclude_none=True)
+
+
 def get_cached(cache_key: str):
     """Get cached data if not expired."""
     cached = _cache.get(cache_key)
@@ -82,10 +110,10 @@ async def get_cluster_overview() -> ClusterOverview:
         # Check cache first
         cached = get_cached("overview")
         if cached:
-            return cached
+            return _json_response(cached.to_json())
         
         aggregator = get_aggregator()
-        overview = aggregator.get_cluster_overview()
+        overview = await aggregator.get_cluster_overview_async()
         
         # Cache result
         set_cache("overview", overview)
@@ -95,7 +123,7 @@ async def get_cluster_overview() -> ClusterOverview:
             {'namespaces': overview.total_namespaces, 'pvcs': overview.total_pvcs}
         )
         
-        return overview
+        return _json_response(overview.to_json())
     except Exception as e:
         logger.log_api_call('GET', '/dashboard/overview', 'GUI', None, 500, None, str(e))
         raise HTTPException(status_code=500, detail="Failed to fetch cluster overview")
@@ -121,7 +149,7 @@ async def get_namespace_summaries(
         if namespaces is None:
             cached = get_cached("summaries")
             if cached:
-                return cached
+                return _json_response(_summaries_json(cached))
         
         aggregator = get_aggregator()
         summaries = await aggregator.get_namespace_summaries_async(namespaces)
@@ -137,7 +165,7 @@ async def get_namespace_summaries(
             {'count': len(summaries)}
         )
         
-        return summaries
+        return _json_response(_summaries_json(summaries))
     except Exception as e:
         logger.log_api_call(
             'GET', '/dashboard/namespaces/summaries', 'GUI',
@@ -146,6 +174,48 @@ async def get_namespace_summaries(
         raise HTTPException(status_code=500, detail="Failed to fetch namespace summaries")
 
 
+@dashboard_router.get("/namespaces/summaries/stream")
+async def stream_namespace_summaries(
+    namespaces: Optional[List[str]] = Query(None)
+) -> StreamingResponse:
+    """Stream namespace summaries as newline-delimited JSON.
+    
+    Each summary is written as soon as its namespace finishes, so clients
+    can render progressively instead of waiting for the slowest namespace.
+    
+    Args:
+        namespaces: Optional list of namespace names to filter to.
+                   If not provided, streams all Run.ai namespaces.
+    
+    Returns:
+        application/x-ndjson stream, one NamespaceSummary per line.
+        Failed namespaces are included with error field set.
+    """
+    try:
+        aggregator = get_aggregator()
+        if namespaces is None:
+            namespaces = await aggregator.list_namespaces_async()
+        
+        logger.log_api_call(
+            'GET', '/dashboard/namespaces/summaries/stream', 'GUI',
+            {'filter_count': len(namespaces)},
+            200,
+            {'count': len(namespaces)}
+        )
+        
+        return StreamingResponse(
+            aggregator.stream_namespace_summaries_jsonl(namespaces),
+            media_type="application/x-ndjson",
+            headers=STREAM_HEADERS
+        )
+    except Exception as e:
+        logger.log_api_call(
+            'GET', '/dashboard/namespaces/summaries/stream', 'GUI',
+            None, 500, None, str(e)
+        )
+        raise HTTPException(status_code=500, detail="Failed to stream namespace summaries")
+
+
 @dashboard_router.get("/graphs/{graph_type}")
 async def get_graph_data(
     graph_type: str,
@@ -179,7 +249,7 @@ async def get_graph_data(
             {'datasets': len(graph_data.datasets)}
         )
         
-        return graph_data
+        return _json_response(graph_data.to_json())
     except ValueError as e:
         logger.log_api_call(
             'GET', f'/dashboard/graphs/{graph_type}', 'GUI',
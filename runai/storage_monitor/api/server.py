@@ -27,36 +27,57 @@ Performance Optimizations:
 - 30-second cache for cluster overview and namespace summaries
 - Batched async fetching (10 concurrent requests max to K8s API)
 - Timeout protection (30s per batch)
+- Concurrent identical requests share a single in-flight K8s fetch
 - WebSocket for live updates (reduces polling)
+- GZip compression for large JSON responses (PVC lists, full analyses)
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Callable, Optional, Dict
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Query
-from fastapi.responses import HTMLResponse, FileResponse, StreamingResponse
+from fastapi.responses import HTMLResponse, FileResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pathlib import Path
 
-from ..core.clients.k8s_client import K8sClient
 from ..core.analyzers.storage_analyzer import StorageAnalyzer
 from ..core.models.storage_models import StorageAnalysis, PermissionReport
 from ..core.logging_manager import get_logger
-from .dashboard_routes import dashboard_router
+from .dashboard_routes import dashboard_router, close_aggregator, STREAM_HEADERS
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 structured_log = get_logger()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the analyzer on startup; release background resources on shutdown.
+    
+    Shutdown stops the dashboard aggregator's workers, the K8s client's
+    watch threads and the structured log writer.
+    """
+    global _analyzer
+    await _warm_analyzer()
+    yield
+    close_aggregator()
+    StorageAnalyzer.close_shared()
+    _analyzer = None
+    structured_log.close()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Run.ai Storage Monitor API",
     description="Read-only storage visibility for Run.ai namespaces",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS configuration (localhost only for security)
@@ -68,6 +89,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON responses; PVC listings and full analyses are highly repetitive.
+# Streaming routes opt out with STREAM_HEADERS so chunks are not held back
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Mount dashboard routes
 app.include_router(dashboard_router)
 
@@ -92,34 +117,84 @@ img_dir = ui_root / "img"
 if img_dir.exists():
     app.mount("/img", StaticFiles(directory=str(img_dir)), name="ui-img")
 
+# UI pages, resolved once at import (None when not packaged)
+_UI_INDEX: Optional[Path] = ui_root / "index.html" if (ui_root / "index.html").exists() else None
+_UI_DASHBOARD: Optional[Path] = ui_root / "dashboard.html" if (ui_root / "dashboard.html").exists() else None
+
 # Global analyzer instance
 _analyzer: Optional[StorageAnalyzer] = None
 
 
+# In-flight analyzer calls, keyed by operation and namespace
+_inflight: Dict[str, asyncio.Future] = {}
+
+
 def get_analyzer() -> StorageAnalyzer:
     """Get or create storage analyzer instance."""
     global _analyzer
     if _analyzer is None:
-        k8s_client = K8sClient()
-        _analyzer = StorageAnalyzer.from_k8s_client(k8s_client)
+        _analyzer = StorageAnalyzer.get_shared(use_cache=True)
     return _analyzer
 
 
+async def run_single_flight(key: str, func: Callable, *args):
+    """Run a blocking analyzer call once for all concurrent callers of the same key.
+    
+    The first caller starts the call in the default executor; callers arriving
+    while it is still running await the same future instead of issuing their
+    own K8s API requests.
+    
+    Args:
+        key: Identifier for the operation (e.g., "analyze:<namespace>")
+        func: Blocking callable to run
+        *args: Arguments passed to func
+        
+    Returns:
+        Result of func(*args)
+    """
+    future = _inflight.get(key)
+    if future is None:
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(None, func, *args)
+        _inflight[key] = future
+        future.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shield so a cancelled request does not cancel the shared call
+    return await asyncio.shield(future)
+
+
+async def _warm_analyzer():
+    """Build the analyzer and load kubeconfig before the first request.
+    
+    Listing the Run.ai namespaces forces the K8s client to initialize, so the
+    kubeconfig load cost is paid at startup rather than by the first user.
+    Failures are logged and left for the request path to report.
+    """
+    try:
+        analyzer = await asyncio.get_running_loop().run_in_executor(None, get_analyzer)
+        await run_single_flight("namespaces", analyzer.list_runai_namespaces)
+    except Exception as e:
+        logger.warning("Analyzer warm-up failed: %s", e)
+
+
+async def analyze_namespace_shared(namespace: str) -> StorageAnalysis:
+    """Analyze a namespace, coalescing concurrent requests for it."""
+    analyzer = get_analyzer()
+    return await run_single_flight(f"analyze:{namespace}", analyzer.analyze_namespace, namespace)
+
+
 @app.get("/")
 async def root():
     """Serve the single-namespace web UI."""
-    ui_path = Path(__file__).parent.parent / "ui" / "index.html"
-    if ui_path.exists():
-        return FileResponse(ui_path)
+    if _UI_INDEX:
+        return FileResponse(_UI_INDEX)
     return {"message": "Run.ai Storage Monitor API", "docs": "/docs"}
 
 
 @app.get("/dashboard.html")
 async def dashboard():
     """Serve the multi-namespace dashboard UI."""
-    dashboard_path = Path(__file__).parent.parent / "ui" / "dashboard.html"
-    if dashboard_path.exists():
-        return FileResponse(dashboard_path)
+    if _UI_DASHBOARD:
+        return FileResponse(_UI_DASHBOARD)
     return {"message": "Dashboard not found"}
 
 
@@ -149,7 +224,7 @@ async def list_namespaces():
     """List all Run.ai namespaces."""
     try:
         analyzer = get_analyzer()
-        namespaces = analyzer.list_runai_namespaces()
+        namespaces = await run_single_flight("namespaces", analyzer.list_runai_namespaces)
         
         structured_log.log_api_call('GET', '/namespaces', 'GUI', None, 200, {'count': len(namespaces)})
         
@@ -166,8 +241,7 @@ async def list_namespaces():
 async def get_namespace_summary(namespace: str):
     """Get storage summary for a namespace."""
     try:
-        analyzer = get_analyzer()
-        analysis = analyzer.analyze_namespace(namespace)
+        analysis = await analyze_namespace_shared(namespace)
         return analysis.summary
     except Exception as e:
         raise HTTPException(status_code=500, detail="Failed to analyze namespace")
@@ -193,18 +267,13 @@ async def get_unused_pvcs(namespace: str):
     """Get unused PVC recommendations for a namespace."""
     try:
         analyzer = get_analyzer()
-        unused_pvcs = analyzer.get_unused_pvcs(namespace)
-        
-        total_unused_capacity = 0.0
-        for pvc_wp in unused_pvcs:
-            capacity_gi = analyzer.pvc_service.parse_capacity_to_gi(pvc_wp.pvc.capacity)
-            total_unused_capacity += capacity_gi
+        unused = analyzer.get_unused_pvcs(namespace)
         
         return {
             "namespace": namespace,
-            "unused_pvcs": [pvc_wp.model_dump() for pvc_wp in unused_pvcs],
-            "count": len(unused_pvcs),
-            "total_unused_capacity_gi": total_unused_capacity
+            "unused_pvcs": [pvc_wp.model_dump() for pvc_wp in unused.pvcs],
+            "count": len(unused.pvcs),
+            "total_unused_capacity_gi": unused.total_capacity_gi
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail="Failed to get unused PVCs")
@@ -215,7 +284,9 @@ async def get_quotas(namespace: str):
     """Get resource quotas for a namespace."""
     try:
         analyzer = get_analyzer()
-        quota = analyzer.quota_service.get_storage_quota(namespace)
+        quota = await run_single_flight(
+            f"quota:{namespace}", analyzer.quota_service.get_full_quota, namespace
+        )
         
         if not quota:
             return {
@@ -237,8 +308,7 @@ async def get_quotas(namespace: str):
 async def get_storage_class_breakdown(namespace: str):
     """Get storage class distribution for a namespace."""
     try:
-        analyzer = get_analyzer()
-        analysis = analyzer.analyze_namespace(namespace)
+        analysis = await analyze_namespace_shared(namespace)
         
         return {
             "namespace": namespace,
@@ -249,12 +319,11 @@ async def get_storage_class_breakdown(namespace: str):
         raise HTTPException(status_code=500, detail="Failed to get storage classes")
 
 
-@app.get("/namespaces/{namespace}/analysis")
-async def get_full_analysis(namespace: str) -> StorageAnalysis:
+@app.get("/namespaces/{namespace}/analysis", response_model=StorageAnalysis)
+async def get_full_analysis(namespace: str) -> Response:
     """Get complete storage analysis for a namespace."""
     try:
-        analyzer = get_analyzer()
-        analysis = analyzer.analyze_namespace(namespace)
+        analysis = await analyze_namespace_shared(namespace)
         
         structured_log.log_storage_action(
             'analyze',
@@ -266,7 +335,7 @@ async def get_full_analysis(namespace: str) -> StorageAnalysis:
         structured_log.log_api_call('GET', f'/namespaces/{namespace}/analysis', 'GUI', None, 200, 
                                    {'pvcs': len(analysis.pvcs), 'recommendations': len(analysis.recommendations)})
         
-        return analysis
+        return Response(content=analysis.to_json(), media_type="application/json")
     except Exception as e:
         structured_log.log_api_call('GET', f'/namespaces/{namespace}/analysis', 'GUI', None, 500, None, str(e))
         raise HTTPException(status_code=500, detail="Failed to analyze namespace")
@@ -302,7 +371,7 @@ async def stream_logs():
             for log in new_logs:
                 yield f"data: {json.dumps(log)}\n\n"
     
-    return StreamingResponse(event_generator(), media_type="text/event-stream")
+    return StreamingResponse(event_generator(), media_type="text/event-stream", headers=STREAM_HEADERS)
 
 
 # WebSocket for real-time updates
@@ -320,11 +389,9 @@ async def websocket_namespace_updates(websocket: WebSocket, namespace: str):
     active_connections[namespace].append(websocket)
     
     try:
-        analyzer = get_analyzer()
-
-        async def safe_send(payload: Dict) -> bool:
+        async def safe_send(text: str) -> bool:
             try:
-                await websocket.send_json(payload)
+                await websocket.send_text(text)
                 return True
             except WebSocketDisconnect:
                 return False
@@ -334,24 +401,37 @@ async def websocket_namespace_updates(websocket: WebSocket, namespace: str):
                     return False
                 raise
 
+        # Digest of the last summary/pvcs body sent on this connection
+        last_digest: Optional[bytes] = None
+
         while True:
-            # Poll every 30 seconds and send updates
+            # Poll every 30 seconds; only send the full update when it changed
             try:
-                analysis = analyzer.analyze_namespace(namespace)
-                payload = {
-                    "type": "update",
-                    "namespace": namespace,
-                    "timestamp": datetime.now().isoformat(),
+                analysis = await analyze_namespace_shared(namespace)
+                body = json.dumps({
                     "summary": analysis.summary.model_dump(mode='json'),
                     "pvcs": [pvc_wp.model_dump(mode='json') for pvc_wp in analysis.pvcs]
+                })
+                digest = hashlib.blake2b(body.encode(), digest_size=16).digest()
+                header = {
+                    "type": "heartbeat" if digest == last_digest else "update",
+                    "namespace": namespace,
+                    "timestamp": datetime.now().isoformat()
                 }
+                if digest == last_digest:
+                    text = json.dumps(header)
+                else:
+                    # Splice the already-serialized body into the header object
+                    text = json.dumps(header)[:-1] + ", " + body[1:]
+                    last_digest = digest
             except Exception as exc:
-                payload = {
+                text = json.dumps({
                     "type": "error",
                     "error": str(exc)
-                }
+                })
+                last_digest = None
 
-            should_continue = await safe_send(payload)
+            should_continue = await safe_send(text)
             if not should_continue:
                 break
 
@@ -378,7 +458,7 @@ def run_server(host: str = "127.0.0.1", port: int = 8081):
     import os
     # Use 0.0.0.0 in Docker, 127.0.0.1 for local
     docker_host = "0.0.0.0" if os.path.exists("/.dockerenv") else host
-    uvicorn.run(app, host=docker_host, port=port)
+    uvicorn.run(app, host=docker_host, port=port, ws_per_message_deflate=True)
 
 
 if __name__ == "__main__":
@@ -16,26 +16,33 @@
 """CLI interface for Run.ai Storage Monitor (Tier 2)."""
 
 import sys
-import json
 import asyncio
 import click
+import orjson
 from pathlib import Path
 from typing import Optional
-from tabulate import tabulate
 
-from .core.clients.k8s_client import K8sClient
-from .core.analyzers.storage_analyzer import StorageAnalyzer
-from .core.services.dashboard_aggregator import DashboardAggregator
+# Heavy dependencies (kubernetes client, analyzers, tabulate) are imported
+# inside the commands that need them to keep CLI startup fast
 
 
 @click.group()
 @click.version_option(version="1.0.0")
-def cli():
+@click.pass_context
+def cli(ctx: click.Context):
     """Run.ai Storage Monitor - Kubernetes storage visibility tool.
     
     A community example tool for DGX Cloud Run.ai deployments.
     """
-    pass
+    ctx.call_on_close(_close_shared_analyzers)
+
+
+def _close_shared_analyzers():
+    """Close the K8s clients of analyzers created by the command."""
+    # Skip the import when the command never built an analyzer
+    storage_analyzer = sys.modules.get(f"{__package__}.core.analyzers.storage_analyzer")
+    if storage_analyzer is not None:
+        storage_analyzer.StorageAnalyzer.close_shared()
 
 
 @cli.command()
@@ -44,8 +51,7 @@ def cli():
 def list_namespaces(kubeconfig: Optional[str], context: Optional[str]):
     """List all Run.ai namespaces."""
     try:
-        k8s_client = K8sClient(kubeconfig_path=kubeconfig, context=context)
-        analyzer = StorageAnalyzer.from_k8s_client(k8s_client)
+        analyzer = _get_analyzer(kubeconfig, context)
         
         namespaces = analyzer.list_runai_namespaces()
         
@@ -70,14 +76,13 @@ def list_namespaces(kubeconfig: Optional[str], context: Optional[str]):
 def analyze(namespace: str, kubeconfig: Optional[str], context: Optional[str], output_format: str):
     """Analyze storage for a namespace."""
     try:
-        k8s_client = K8sClient(kubeconfig_path=kubeconfig, context=context)
-        analyzer = StorageAnalyzer.from_k8s_client(k8s_client)
+        analyzer = _get_analyzer(kubeconfig, context)
         
         click.echo(f"Analyzing storage for namespace: {namespace}...")
         analysis = analyzer.analyze_namespace(namespace)
         
         if output_format == "json":
-            click.echo(analysis.model_dump_json(indent=2))
+            click.echo(orjson.dumps(analysis.model_dump(mode="json"), option=orjson.OPT_INDENT_2))
         else:
             _print_text_analysis(analysis)
     
@@ -93,10 +98,12 @@ def analyze(namespace: str, kubeconfig: Optional[str], context: Optional[str], o
 def unused(namespace: str, kubeconfig: Optional[str], context: Optional[str]):
     """List unused PVCs in a namespace."""
     try:
-        k8s_client = K8sClient(kubeconfig_path=kubeconfig, context=context)
-        analyzer = StorageAnalyzer.from_k8s_client(k8s_client)
+        from tabulate import tabulate
         
-        unused_pvcs = analyzer.get_unused_pvcs(namespace)
+        analyzer = _get_analyzer(kubeconfig, context)
+        
+        unused = analyzer.get_unused_pvcs(namespace)
+        unused_pvcs = unused.pvcs
         
         if not unused_pvcs:
             click.echo(f"No unused PVCs found in namespace: {namespace}")
@@ -104,19 +111,15 @@ def unused(namespace: str, kubeconfig: Optional[str], context: Optional[str]):
         
         click.echo(f"Found {len(unused_pvcs)} unused PVCs in {namespace}:\n")
         
-        table_data = []
-        total_capacity_gi = 0.0
-        
-        for pvc_wp in unused_pvcs:
-            capacity_gi = analyzer.pvc_service.parse_capacity_to_gi(pvc_wp.pvc.capacity)
-            total_capacity_gi += capacity_gi
-            
-            table_data.append([
-                pvc_wp.pvc.name,
-                pvc_wp.pvc.capacity,
-                pvc_wp.pvc.storage_class or "default",
-                f"{pvc_wp.pvc.age_days}d" if pvc_wp.pvc.age_days else "Unknown"
-            ])
+        table_data = [
+            [
+                pvc.name,
+                pvc.capacity,
+                pvc.storage_class or "default",
+                f"{pvc.age_days}d" if pvc.age_days else "Unknown"
+            ]
+            for pvc in (pvc_wp.pvc for pvc_wp in unused_pvcs)
+        ]
         
         click.echo(tabulate(
             table_data,
@@ -124,7 +127,7 @@ def unused(namespace: str, kubeconfig: Optional[str], context: Optional[str]):
             tablefmt="simple"
         ))
         
-        click.echo(f"\nTotal unused capacity: {total_capacity_gi:.2f}Gi")
+        click.echo(f"\nTotal unused capacity: {unused.total_capacity_gi:.2f}Gi")
     
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -138,8 +141,7 @@ def unused(namespace: str, kubeconfig: Optional[str], context: Optional[str]):
 def quotas(namespace: str, kubeconfig: Optional[str], context: Optional[str]):
     """Show resource quotas for a namespace."""
     try:
-        k8s_client = K8sClient(kubeconfig_path=kubeconfig, context=context)
-        analyzer = StorageAnalyzer.from_k8s_client(k8s_client)
+        analyzer = _get_analyzer(kubeconfig, context)
         
         quota = analyzer.quota_service.get_storage_quota(namespace)
         
@@ -148,18 +150,20 @@ def quotas(namespace: str, kubeconfig: Optional[str], context: Optional[str]):
             click.echo("\nConsider adding storage quotas to control usage.")
             return
         
-        click.echo(f"Resource Quotas for {namespace}:\n")
+        out = [f"Resource Quotas for {namespace}:\n"]
         
         if quota.storage_limit:
-            click.echo(f"Storage Limit: {quota.storage_limit}")
+            out.append(f"Storage Limit: {quota.storage_limit}")
             if quota.storage_used:
-                click.echo(f"Storage Used: {quota.storage_used}")
+                out.append(f"Storage Used: {quota.storage_used}")
         
         if quota.pvc_count_limit:
-            click.echo(f"PVC Count Limit: {quota.pvc_count_limit}")
+            out.append(f"PVC Count Limit: {quota.pvc_count_limit}")
             if quota.pvc_count_used is not None:
                 usage_pct = (quota.pvc_count_used / quota.pvc_count_limit) * 100
-                click.echo(f"PVC Count Used: {quota.pvc_count_used} ({usage_pct:.1f}%)")
+                out.append(f"PVC Count Used: {quota.pvc_count_used} ({usage_pct:.1f}%)")
+        
+        click.echo("\n".join(out))
     
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -175,31 +179,21 @@ def quotas(namespace: str, kubeconfig: Optional[str], context: Optional[str]):
 def export(namespace: str, output_file: str, kubeconfig: Optional[str], context: Optional[str], output_format: str):
     """Export storage analysis to file."""
     try:
-        k8s_client = K8sClient(kubeconfig_path=kubeconfig, context=context)
-        analyzer = StorageAnalyzer.from_k8s_client(k8s_client)
+        analyzer = _get_analyzer(kubeconfig, context)
         
         click.echo(f"Analyzing {namespace}...")
         analysis = analyzer.analyze_namespace(namespace)
         
         if output_format == "json":
-            with open(output_file, "w") as f:
-                f.write(analysis.model_dump_json(indent=2))
+            with open(output_file, "wb") as f:
+                f.write(orjson.dumps(analysis.model_dump(mode="json"), option=orjson.OPT_INDENT_2))
         elif output_format == "csv":
             # Simple CSV export of PVCs
             import csv
             with open(output_file, "w", newline="") as f:
                 writer = csv.writer(f)
                 writer.writerow(["Name", "Status", "Capacity", "Storage Class", "Pods", "Unused", "Age (days)"])
-                for pvc_wp in analysis.pvcs:
-                    writer.writerow([
-                        pvc_wp.pvc.name,
-                        pvc_wp.pvc.status,
-                        pvc_wp.pvc.capacity,
-                        pvc_wp.pvc.storage_class or "default",
-                        len(pvc_wp.pods),
-                        "Yes" if pvc_wp.is_unused else "No",
-                        pvc_wp.pvc.age_days or "Unknown"
-                    ])
+                writer.writerows(_pvc_csv_rows(analysis.pvcs))
         
         click.echo(f"Analysis exported to: {output_file}")
     
@@ -214,7 +208,7 @@ def export(namespace: str, output_file: str, kubeconfig: Optional[str], context:
 def check_permissions(kubeconfig: Optional[str], context: Optional[str]):
     """Check Kubernetes permissions."""
     try:
-        k8s_client = K8sClient(kubeconfig_path=kubeconfig, context=context)
+        k8s_client = _get_k8s_client(kubeconfig, context)
         
         click.echo("Checking Kubernetes permissions...\n")
         permissions = k8s_client.check_permissions()
@@ -270,43 +264,125 @@ def status():
     click.echo("Daemon status check not yet implemented")
 
 
+def _get_analyzer(kubeconfig: Optional[str], context: Optional[str]):
+    """Get the shared storage analyzer for kubeconfig/context."""
+    from .core.analyzers.storage_analyzer import StorageAnalyzer
+    return StorageAnalyzer.get_shared(kubeconfig, context)
+
+
+def _get_k8s_client(kubeconfig: Optional[str], context: Optional[str]):
+    """Get the Kubernetes API client of the shared analyzer.
+    
+    Args:
+        kubeconfig: Path to kubeconfig file
+        context: Kubernetes context to use
+        
+    Returns:
+        K8sClient instance
+    """
+    return _get_analyzer(kubeconfig, context).pvc_service.k8s
+
+
+def _get_aggregator(kubeconfig: Optional[str], context: Optional[str], label_selector: Optional[str] = None):
+    """Get a dashboard aggregator over the shared analyzer for kubeconfig/context."""
+    from .core.services.dashboard_aggregator import DashboardAggregator
+    return DashboardAggregator(_get_analyzer(kubeconfig, context), label_selector=label_selector)
+
+
+def _run(coro):
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    
+    if hasattr(uvloop, "run"):
+        return uvloop.run(coro)
+    
+    # uvloop < 0.18 has no run() helper
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(coro)
+
+
+_YES_NO = ("No", "Yes")
+
+
+def _pvc_csv_rows(pvcs_with_pods):
+    """Yield CSV rows for PVCs in an analysis export."""
+    yes_no = _YES_NO
+    for pvc_wp in pvcs_with_pods:
+        pvc = pvc_wp.pvc
+        age_days = pvc.age_days
+        yield (
+            pvc.name,
+            pvc.status,
+            pvc.capacity,
+            pvc.storage_class or "default",
+            len(pvc_wp.pods),
+            yes_no[pvc_wp.is_unused],
+            "Unknown" if age_days is None else age_days
+        )
+
+
+_SUMMARY_CSV_HEADER = ("namespace", "total_pvcs", "unused_pvcs", "total_capacity_gi",
+                       "unused_capacity_gi", "has_quota", "error")
+
+
+def _summary_csv_rows(namespace_summaries):
+    """Yield CSV rows for namespace summaries in a dashboard export."""
+    for s in namespace_summaries:
+        yield (
+            s.namespace,
+            s.total_pvcs,
+            s.unused_pvcs,
+            f"{s.total_capacity_gi:.2f}",
+            f"{s.unused_capacity_gi:.2f}",
+            s.has_quota,
+            s.error or ""
+        )
+
+
 def _print_text_analysis(analysis):
     """Print analysis in human-readable text format."""
-    click.echo("\n" + "=" * 60)
-    click.echo(f"Storage Analysis: {analysis.namespace}")
-    click.echo("=" * 60)
-    
-    # Summary
-    click.echo("\nSummary:")
-    click.echo(f"  Total PVCs: {analysis.summary.total_pvcs}")
-    click.echo(f"  Bound: {analysis.summary.bound_pvcs}")
-    click.echo(f"  Pending: {analysis.summary.pending_pvcs}")
-    click.echo(f"  Unused: {analysis.summary.unused_pvcs}")
-    click.echo(f"  Total Capacity: {analysis.summary.total_capacity_gi:.2f}Gi")
-    click.echo(f"  Unused Capacity: {analysis.summary.unused_capacity_gi:.2f}Gi")
+    summary = analysis.summary
+    out = [
+        "\n" + "=" * 60,
+        f"Storage Analysis: {analysis.namespace}",
+        "=" * 60,
+        # Summary
+        "\nSummary:",
+        f"  Total PVCs: {summary.total_pvcs}",
+        f"  Bound: {summary.bound_pvcs}",
+        f"  Pending: {summary.pending_pvcs}",
+        f"  Unused: {summary.unused_pvcs}",
+        f"  Total Capacity: {summary.total_capacity_gi:.2f}Gi",
+        f"  Unused Capacity: {summary.unused_capacity_gi:.2f}Gi",
+    ]
     
     # Storage classes
-    if analysis.summary.storage_classes:
-        click.echo("\nStorage Classes:")
-        for sc, count in analysis.summary.storage_classes.items():
-            click.echo(f"  {sc}: {count} PVCs")
+    if summary.storage_classes:
+        out.append("\nStorage Classes:")
+        out.extend(f"  {sc}: {count} PVCs" for sc, count in summary.storage_classes.items())
     
     # Quotas
-    if analysis.summary.has_quota and analysis.summary.quota:
-        click.echo("\nResource Quota:")
-        quota = analysis.summary.quota
+    if summary.has_quota and summary.quota:
+        out.append("\nResource Quota:")
+        quota = summary.quota
         if quota.storage_limit:
-            click.echo(f"  Storage: {quota.storage_used or '0'} / {quota.storage_limit}")
+            out.append(f"  Storage: {quota.storage_used or '0'} / {quota.storage_limit}")
         if quota.pvc_count_limit:
-            click.echo(f"  PVC Count: {quota.pvc_count_used or 0} / {quota.pvc_count_limit}")
+            out.append(f"  PVC Count: {quota.pvc_count_used or 0} / {quota.pvc_count_limit}")
     
     # Recommendations
     if analysis.recommendations:
-        click.echo("\nRecommendations:")
+        out.append("\nRecommendations:")
         for rec in analysis.recommendations:
             severity_icon = "⚠️" if rec.severity == "warning" else "ℹ️" if rec.severity == "info" else "❌"
-            click.echo(f"  {severity_icon} {rec.title}")
-            click.echo(f"     {rec.description}")
+            out.append(f"  {severity_icon} {rec.title}")
+            out.append(f"     {rec.description}")
+    
+    # Single write instead of one echo per line
+    click.echo("\n".join(out))
 
 
 @cli.group()
@@ -318,26 +394,28 @@ def dashboard():
 @dashboard.command()
 @click.option("--kubeconfig", type=click.Path(exists=True), help="Path to kubeconfig file")
 @click.option("--context", help="Kubernetes context to use")
+@click.option("--label-selector", help="Namespace label selector applied by the API server (e.g. 'team=ml')")
 @click.option("--format", "output_format", type=click.Choice(["text", "json"]), default="text")
-def overview(kubeconfig: Optional[str], context: Optional[str], output_format: str):
+def overview(kubeconfig: Optional[str], context: Optional[str], label_selector: Optional[str], output_format: str):
     """Get cluster-wide storage overview."""
     try:
-        k8s_client = K8sClient(kubeconfig_path=kubeconfig, context=context)
-        aggregator = DashboardAggregator.from_k8s_client(k8s_client)
+        aggregator = _get_aggregator(kubeconfig, context, label_selector)
         
-        cluster_overview = aggregator.get_cluster_overview()
+        cluster_overview = _run(aggregator.get_cluster_overview_async())
         
         if output_format == "json":
-            click.echo(cluster_overview.model_dump_json(indent=2))
+            click.echo(orjson.dumps(cluster_overview.model_dump(mode="json"), option=orjson.OPT_INDENT_2))
         else:
-            click.echo("\nCluster Storage Overview")
-            click.echo("=" * 50)
-            click.echo(f"Total Namespaces:        {cluster_overview.total_namespaces}")
-            click.echo(f"Total PVCs:              {cluster_overview.total_pvcs}")
-            click.echo(f"Total Capacity:          {cluster_overview.total_capacity_gi:.2f} GiB")
-            click.echo(f"Unused Capacity:         {cluster_overview.unused_capacity_gi:.2f} GiB")
-            click.echo(f"Total Unused PVCs:       {cluster_overview.total_unused_pvcs}")
-            click.echo(f"Namespaces with Quota:   {cluster_overview.namespaces_with_quota}")
+            click.echo("\n".join([
+                "\nCluster Storage Overview",
+                "=" * 50,
+                f"Total Namespaces:        {cluster_overview.total_namespaces}",
+                f"Total PVCs:              {cluster_overview.total_pvcs}",
+                f"Total Capacity:          {cluster_overview.total_capacity_gi:.2f} GiB",
+                f"Unused Capacity:         {cluster_overview.unused_capacity_gi:.2f} GiB",
+                f"Total Unused PVCs:       {cluster_overview.total_unused_pvcs}",
+                f"Namespaces with Quota:   {cluster_overview.namespaces_with_quota}"
+            ]))
     
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -347,24 +425,26 @@ def overview(kubeconfig: Optional[str], context: Optional[str], output_format: s
 @dashboard.command()
 @click.option("--kubeconfig", type=click.Path(exists=True), help="Path to kubeconfig file")
 @click.option("--context", help="Kubernetes context to use")
+@click.option("--label-selector", help="Namespace label selector applied by the API server (e.g. 'team=ml')")
 @click.option("--format", "output_format", type=click.Choice(["text", "json", "csv"]), default="text")
-def summaries(kubeconfig: Optional[str], context: Optional[str], output_format: str):
+def summaries(kubeconfig: Optional[str], context: Optional[str], label_selector: Optional[str], output_format: str):
     """Get storage summaries for all namespaces."""
     try:
-        k8s_client = K8sClient(kubeconfig_path=kubeconfig, context=context)
-        aggregator = DashboardAggregator.from_k8s_client(k8s_client)
+        aggregator = _get_aggregator(kubeconfig, context, label_selector)
         
-        namespace_summaries = asyncio.run(aggregator.get_namespace_summaries_async())
+        namespace_summaries = _run(aggregator.get_namespace_summaries_async())
         
         if output_format == "json":
-            summaries_dict = [s.model_dump() for s in namespace_summaries]
-            click.echo(json.dumps(summaries_dict, indent=2))
+            summaries_dict = [s.model_dump(mode="json") for s in namespace_summaries]
+            click.echo(orjson.dumps(summaries_dict, option=orjson.OPT_INDENT_2))
         elif output_format == "csv":
-            click.echo("namespace,total_pvcs,unused_pvcs,total_capacity_gi,unused_capacity_gi,has_quota,error")
-            for s in namespace_summaries:
-                click.echo(f"{s.namespace},{s.total_pvcs},{s.unused_pvcs},{s.total_capacity_gi:.2f}," +
-                          f"{s.unused_capacity_gi:.2f},{s.has_quota},{s.error or ''}")
+            import csv
+            writer = csv.writer(sys.stdout, lineterminator="\n")
+            writer.writerow(_SUMMARY_CSV_HEADER)
+            writer.writerows(_summary_csv_rows(namespace_summaries))
         else:
+            from tabulate import tabulate
+            
             headers = ["Namespace", "Total PVCs", "Unused PVCs", "Total Capacity", "Unused Capacity", "Has Quota"]
             rows = []
             for s in namespace_summaries:
@@ -377,7 +457,7 @@ def summaries(kubeconfig: Optional[str], context: Optional[str], output_format:
                         s.unused_pvcs,
                         f"{s.total_capacity_gi:.2f} GiB",
                         f"{s.unused_capacity_gi:.2f} GiB",
-                        "Yes" if s.has_quota else "No"
+                        _YES_NO[s.has_quota]
                     ])
             click.echo("\n" + tabulate(rows, headers=headers, tablefmt="simple"))
     
@@ -390,30 +470,30 @@ def summaries(kubeconfig: Optional[str], context: Optional[str], output_format:
 @click.argument("output_file", type=click.Path())
 @click.option("--kubeconfig", type=click.Path(exists=True), help="Path to kubeconfig file")
 @click.option("--context", help="Kubernetes context to use")
+@click.option("--label-selector", help="Namespace label selector applied by the API server (e.g. 'team=ml')")
 @click.option("--format", "output_format", type=click.Choice(["json", "csv"]), default="json")
-def export(output_file: str, kubeconfig: Optional[str], context: Optional[str], output_format: str):
+def export(output_file: str, kubeconfig: Optional[str], context: Optional[str], label_selector: Optional[str],
+           output_format: str):
     """Export dashboard data to file."""
     try:
-        k8s_client = K8sClient(kubeconfig_path=kubeconfig, context=context)
-        aggregator = DashboardAggregator.from_k8s_client(k8s_client)
+        aggregator = _get_aggregator(kubeconfig, context, label_selector)
         
-        cluster_overview = aggregator.get_cluster_overview()
-        namespace_summaries = asyncio.run(aggregator.get_namespace_summaries_async())
+        cluster_overview, namespace_summaries = _run(aggregator.get_dashboard_snapshot_async())
         
         output_path = Path(output_file)
         
         if output_format == "json":
             data = {
-                "overview": cluster_overview.model_dump(),
-                "namespaces": [s.model_dump() for s in namespace_summaries]
+                "overview": cluster_overview.model_dump(mode="json"),
+                "namespaces": [s.model_dump(mode="json") for s in namespace_summaries]
             }
-            output_path.write_text(json.dumps(data, indent=2, default=str))
+            output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         else:
-            lines = ["namespace,total_pvcs,unused_pvcs,total_capacity_gi,unused_capacity_gi,has_quota,error"]
-            for s in namespace_summaries:
-                lines.append(f"{s.namespace},{s.total_pvcs},{s.unused_pvcs},{s.total_capacity_gi:.2f}," +
-                           f"{s.unused_capacity_gi:.2f},{s.has_quota},{s.error or ''}")
-            output_path.write_text("\n".join(lines))
+            import csv
+            with open(output_path, "w", newline="") as f:
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(_SUMMARY_CSV_HEADER)
+                writer.writerows(_summary_csv_rows(namespace_summaries))
         
         click.echo(f"Dashboard data exported to: {output_path}")
     
@@ -426,16 +506,17 @@ def export(output_file: str, kubeconfig: Optional[str], context: Optional[str],
 @click.argument("graph_type")
 @click.option("--kubeconfig", type=click.Path(exists=True), help="Path to kubeconfig file")
 @click.option("--context", help="Kubernetes context to use")
+@click.option("--label-selector", help="Namespace label selector applied by the API server (e.g. 'team=ml')")
 @click.option("--limit", type=int, help="Limit for top-N graphs")
-def graph(graph_type: str, kubeconfig: Optional[str], context: Optional[str], limit: Optional[int]):
+def graph(graph_type: str, kubeconfig: Optional[str], context: Optional[str], label_selector: Optional[str],
+          limit: Optional[int]):
     """Generate graph data for specific visualization."""
     try:
-        k8s_client = K8sClient(kubeconfig_path=kubeconfig, context=context)
-        aggregator = DashboardAggregator.from_k8s_client(k8s_client)
+        aggregator = _get_aggregator(kubeconfig, context, label_selector)
         
-        graph_data = asyncio.run(aggregator.get_graph_data_async(graph_type, limit=limit))
+        graph_data = _run(aggregator.get_graph_data_async(graph_type, limit=limit))
         
-        click.echo(graph_data.model_dump_json(indent=2))
+        click.echo(orjson.dumps(graph_data.model_dump(mode="json"), option=orjson.OPT_INDENT_2))
     
     except ValueError as e:
         click.echo(f"Invalid graph type: {e}", err=True)
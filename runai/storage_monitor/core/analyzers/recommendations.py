@@ -15,10 +15,15 @@
 
 """Recommendation engine for storage optimization."""
 
+from functools import lru_cache
 from typing import Callable, List, Optional
 from ..models.storage_models import PVCWithPods, ResourceQuota, Recommendation, StorageSummary
 
 
+_UNUSED_DESC = "(%s) not mounted to any pods. Consider cleanup to reclaim storage."
+_OLD_UNUSED_DESC = "Unused for over 30 days. Likely safe to delete."
+
+
 class RecommendationEngine:
     """Generate storage optimization recommendations."""
     
@@ -29,19 +34,23 @@ class RecommendationEngine:
             capacity_parser: Callable that converts capacity strings to GiB.
         """
         self.capacity_parser = capacity_parser
+        # Capacity strings ("100Gi", "1Ti") repeat heavily across PVCs, so
+        # memoize per engine; lru_cache is safe to share across threads
+        self._parse_capacity = lru_cache(maxsize=256)(self._parse_capacity_uncached)
     
-    def _parse_capacity(self, capacity: Optional[str]) -> Optional[float]:
+    def _parse_capacity_uncached(self, capacity: Optional[str]) -> Optional[float]:
         """Safely parse capacity string to GiB using configured parser."""
-        if not self.capacity_parser or not capacity:
+        parser = self.capacity_parser
+        if parser is None or not capacity:
             return None
         try:
-            value = self.capacity_parser(capacity)
-            # Ensure numeric and non-negative
-            if value is not None and value >= 0:
-                return float(value)
-            return None
-        except Exception:
+            value = parser(capacity)
+        except (ValueError, TypeError, AttributeError):
             return None
+        # Ensure numeric and non-negative (NaN fails the comparison)
+        if isinstance(value, (int, float)) and value >= 0:
+            return float(value)
+        return None
     
     def generate_recommendations(
         self,
@@ -51,6 +60,9 @@ class RecommendationEngine:
     ) -> List[Recommendation]:
         """Generate recommendations based on storage analysis.
         
+        Recommendations are built with model_construct (no validation), so
+        the engine is responsible for producing valid field values.
+        
         Args:
             pvcs_with_pods: List of PVCs with pod information
             summary: Storage summary statistics
@@ -60,39 +72,44 @@ class RecommendationEngine:
             List of recommendations
         """
         recommendations = []
+        unused_count = 0
+        old_unused_count = 0
         
-        # Check for unused PVCs
-        unused_pvcs = [pvc_wp for pvc_wp in pvcs_with_pods if pvc_wp.is_unused]
-        if unused_pvcs:
-            for pvc_wp in unused_pvcs:
-                capacity_gi = self._parse_capacity(pvc_wp.pvc.capacity)
-                recommendations.append(Recommendation(
-                    type="unused_pvc",
-                    severity="warning",
-                    title=f"{pvc_wp.pvc.name}",
-                    description=f"({pvc_wp.pvc.capacity}) not mounted to any pods. Consider cleanup to reclaim storage.",
-                    pvc_name=pvc_wp.pvc.name,
-                    capacity=pvc_wp.pvc.capacity,
-                    capacity_gi=capacity_gi,
-                    age_days=pvc_wp.pvc.age_days,
-                    actionable=True
-                ))
-            
-            # Summary recommendation for unused storage
-            if summary.unused_capacity_gi > 0:
-                recommendations.append(Recommendation(
-                    type="unused_storage_summary",
-                    severity="info",
-                    title=f"{summary.unused_capacity_gi:.2f}Gi Available for Reclamation",
-                    description=f"{len(unused_pvcs)} PVCs not in use. Consider cleanup to save costs and free quota.",
-                    capacity=f"{summary.unused_capacity_gi:.2f}Gi",
-                    capacity_gi=summary.unused_capacity_gi,
-                    actionable=True
-                ))
+        # Check for unused PVCs (single pass, also counting orphaned ones)
+        for pvc_wp in pvcs_with_pods:
+            if not pvc_wp.is_unused:
+                continue
+            pvc = pvc_wp.pvc
+            unused_count += 1
+            if pvc.age_days and pvc.age_days > 30:
+                old_unused_count += 1
+            recommendations.append(Recommendation.model_construct(
+                type="unused_pvc",
+                severity="warning",
+                title=pvc.name,
+                description=_UNUSED_DESC % pvc.capacity,
+                pvc_name=pvc.name,
+                capacity=pvc.capacity,
+                capacity_gi=self._parse_capacity(pvc.capacity),
+                age_days=pvc.age_days,
+                actionable=True
+            ))
+        
+        # Summary recommendation for unused storage
+        if unused_count and summary.unused_capacity_gi > 0:
+            recommendations.append(Recommendation.model_construct(
+                type="unused_storage_summary",
+                severity="info",
+                title=f"{summary.unused_capacity_gi:.2f}Gi Available for Reclamation",
+                description=f"{unused_count} PVCs not in use. Consider cleanup to save costs and free quota.",
+                capacity=f"{summary.unused_capacity_gi:.2f}Gi",
+                capacity_gi=summary.unused_capacity_gi,
+                actionable=True
+            ))
         
         # Check for pending PVCs
         if summary.pending_pvcs > 0:
-            recommendations.append(Recommendation(
+            recommendations.append(Recommendation.model_construct(
                 type="pending_pvc",
                 severity="error",
                 title=f"{summary.pending_pvcs} PVCs Waiting for Provisioning",
@@ -101,16 +118,12 @@ class RecommendationEngine:
             ))
         
         # Check for old unused PVCs (potential orphaned resources)
-        old_unused = [
-            pvc_wp for pvc_wp in unused_pvcs
-            if pvc_wp.pvc.age_days and pvc_wp.pvc.age_days > 30
-        ]
-        if old_unused:
-            recommendations.append(Recommendation(
+        if old_unused_count:
+            recommendations.append(Recommendation.model_construct(
                 type="old_unused_pvc",
                 severity="warning",
-                title=f"{len(old_unused)} Orphaned Resources Detected",
-                description=f"Unused for over 30 days. Likely safe to delete.",
+                title=f"{old_unused_count} Orphaned Resources Detected",
+                description=_OLD_UNUSED_DESC,
                 actionable=True
             ))
         
@@ -13,23 +13,39 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Storage analyzer - orchestrates analysis across services."""
+"""Storage analyzer - orchestrates analysis across services.
 
+PVC usage (``PVCWithPods.is_unused``) comes from
+``PVCService.get_pvcs_with_pods``, which indexes pods by claim name in a
+single pass and looks each PVC up in that index. Keep the correlation
+O(pods + PVCs); never scan the pod list per PVC.
+"""
+
+import threading
+from collections import Counter
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from ..services.pvc_service import PVCService
-from ..services.namespace_service import NamespaceService
+from ..services.namespace_service import NamespaceService, RUNAI_NAMESPACE_PREFIX
 from ..services.quota_service import QuotaService
 from ..clients.k8s_client import K8sClient
+from ..clients.namespace_snapshot import NamespaceSnapshot
 from ..models.storage_models import (
     StorageAnalysis,
     StorageSummary,
     StorageClass,
-    Recommendation
+    Recommendation,
+    UnusedPvcsResult
 )
 from .recommendations import RecommendationEngine
 
 
+# Shared analyzers kept by StorageAnalyzer.get_shared, keyed by
+# (kubeconfig, context, use_cache); released by StorageAnalyzer.close_shared
+_shared_analyzers: Dict[Tuple[Optional[str], Optional[str], bool], "StorageAnalyzer"] = {}
+_shared_lock = threading.Lock()
+
+
 class StorageAnalyzer:
     """High-level storage analyzer orchestrating all services."""
     
@@ -73,27 +89,92 @@ class StorageAnalyzer:
             quota_service=quota_service
         )
     
-    def analyze_namespace(self, namespace: str) -> StorageAnalysis:
+    @classmethod
+    def get_shared(
+        cls,
+        kubeconfig_path: Optional[str] = None,
+        context: Optional[str] = None,
+        use_cache: bool = False
+    ) -> "StorageAnalyzer":
+        """Get the process-wide analyzer for a kubeconfig/context.
+        
+        Reusing one analyzer per cluster keeps the loaded kubeconfig, warm
+        connection pool and (with use_cache) the watch caches across
+        requests instead of rebuilding them for every handler call.
+        
+        Args:
+            kubeconfig_path: Path to kubeconfig file (default: ~/.kube/config)
+            context: Kubernetes context to use (default: current context)
+            use_cache: Serve list calls from list+watch caches
+            
+        Returns:
+            Shared StorageAnalyzer instance
+        """
+        key = (kubeconfig_path, context, use_cache)
+        # Serialized so concurrent first calls cannot start duplicate watches
+        with _shared_lock:
+            analyzer = _shared_analyzers.get(key)
+            if analyzer is None:
+                # Caches mirror only the Run.ai namespaces the tool reports on
+                k8s_client = K8sClient(
+                    kubeconfig_path=kubeconfig_path,
+                    context=context,
+                    use_cache=use_cache,
+                    cache_namespace_prefix=RUNAI_NAMESPACE_PREFIX
+                )
+                analyzer = _shared_analyzers[key] = cls.from_k8s_client(k8s_client)
+            return analyzer
+    
+    @classmethod
+    def close_shared(cls):
+        """Close the K8s clients of all shared analyzers and forget them.
+        
+        Stops their reflector watch threads; called on server and CLI
+        shutdown.
+        """
+        with _shared_lock:
+            analyzers = list(_shared_analyzers.values())
+            _shared_analyzers.clear()
+        
+        for analyzer in analyzers:
+            analyzer.pvc_service.k8s.close()
+    
+    def analyze_namespace(self, namespace: str, quotas: Optional[List[dict]] = None) -> StorageAnalysis:
         """Perform complete storage analysis for a namespace.
         
         Args:
             namespace: Kubernetes namespace to analyze
+            quotas: Resource quota dicts already fetched for the namespace
+                (see K8sClient.list_resource_quotas_by_namespace)
             
         Returns:
             Complete storage analysis with recommendations
         """
+        k8s = self.pvc_service.k8s
+        
+        # One list call per resource, shared by every service below
+        snapshot = NamespaceSnapshot(k8s, namespace, quotas)
+        
+        if k8s.serves_from_cache(namespace):
+            # In-memory reflector reads; nothing to overlap
+            snapshot.prefetch()
+            storage_classes = self._get_storage_classes()
+        else:
+            # Storage classes are cluster-scoped; fetch them while the
+            # namespaced PVC, pod and quota lists are fetched concurrently
+            storage_classes_future = k8s.submit(self._get_storage_classes)
+            snapshot.prefetch()
+            storage_classes = storage_classes_future.result()
+        
         # Get PVCs with pod information
-        pvcs_with_pods = self.pvc_service.get_pvcs_with_pods(namespace)
+        pvcs_with_pods = self.pvc_service.get_pvcs_with_pods(namespace, snapshot)
         
         # Get quota information
-        quota = self.quota_service.get_storage_quota(namespace)
+        quota = self.quota_service.get_storage_quota(namespace, snapshot)
         
         # Calculate summary statistics
         summary = self._calculate_summary(namespace, pvcs_with_pods, quota)
         
-        # Get storage classes
-        storage_classes = self._get_storage_classes()
-        
         # Generate recommendations
         recommendations = self.recommendation_engine.generate_recommendations(
             pvcs_with_pods, summary, quota
@@ -120,25 +201,32 @@ class StorageAnalyzer:
             Storage summary
         """
         total_pvcs = len(pvcs_with_pods)
-        bound_pvcs = sum(1 for pvc_wp in pvcs_with_pods if pvc_wp.pvc.status == "Bound")
-        pending_pvcs = sum(1 for pvc_wp in pvcs_with_pods if pvc_wp.pvc.status == "Pending")
-        unused_pvcs = sum(1 for pvc_wp in pvcs_with_pods if pvc_wp.is_unused)
-        
-        # Calculate total capacity
+        bound_pvcs = 0
+        pending_pvcs = 0
+        unused_pvcs = 0
         total_capacity_gi = 0.0
         unused_capacity_gi = 0.0
-        storage_class_counts = {}
+        storage_class_names = []
+        add_storage_class = storage_class_names.append
+        parse_capacity = self.pvc_service.parse_capacity_to_gi
         
+        # Single pass for counts, capacity totals and storage classes
         for pvc_wp in pvcs_with_pods:
-            capacity_gi = self.pvc_service.parse_capacity_to_gi(pvc_wp.pvc.capacity)
+            pvc = pvc_wp.pvc
+            status = pvc.status
+            if status == "Bound":
+                bound_pvcs += 1
+            elif status == "Pending":
+                pending_pvcs += 1
+            
+            capacity_gi = parse_capacity(pvc.capacity)
             total_capacity_gi += capacity_gi
             
             if pvc_wp.is_unused:
+                unused_pvcs += 1
                 unused_capacity_gi += capacity_gi
             
-            # Count by storage class
-            sc = pvc_wp.pvc.storage_class or "default"
-            storage_class_counts[sc] = storage_class_counts.get(sc, 0) + 1
+            add_storage_class(pvc.storage_class or "default")
         
         return StorageSummary(
             namespace=namespace,
@@ -148,7 +236,8 @@ class StorageAnalyzer:
             unused_pvcs=unused_pvcs,
             total_capacity_gi=total_capacity_gi,
             unused_capacity_gi=unused_capacity_gi,
-            storage_classes=storage_class_counts,
+            # Count by storage class in one C-level pass
+            storage_classes=dict(Counter(storage_class_names)),
             has_quota=(quota is not None),
             quota=quota
         )
@@ -177,23 +266,30 @@ class StorageAnalyzer:
         except Exception:
             return []
     
-    def list_runai_namespaces(self) -> List[str]:
+    def list_runai_namespaces(self, label_selector: Optional[str] = None) -> List[str]:
         """List Run.ai namespaces (convenience method).
         
+        Args:
+            label_selector: Optional namespace label selector
+            
         Returns:
             List of Run.ai namespace names
         """
-        return self.namespace_service.list_runai_namespaces()
+        return self.namespace_service.list_runai_namespaces(label_selector)
     
-    def get_unused_pvcs(self, namespace: str) -> List:
-        """Get list of unused PVCs (convenience method).
+    def get_unused_pvcs(self, namespace: str) -> UnusedPvcsResult:
+        """Get unused PVCs and their total capacity (convenience method).
         
         Args:
             namespace: Kubernetes namespace
             
         Returns:
-            List of unused PVCs with pods
+            Unused PVCs with pods and their summed capacity in GiB
         """
         pvcs_with_pods = self.pvc_service.get_pvcs_with_pods(namespace)
-        return [pvc_wp for pvc_wp in pvcs_with_pods if pvc_wp.is_unused]
-
+        unused_pvcs = [pvc_wp for pvc_wp in pvcs_with_pods if pvc_wp.is_unused]
+        total_capacity_gi = sum(self.pvc_service.parse_capacities_to_gi(
+            pvc_wp.pvc.capacity for pvc_wp in unused_pvcs
+        ))
+        
+        return UnusedPvcsResult(pvcs=unused_pvcs, total_capacity_gi=total_capacity_gi)
@@ -15,9 +15,150 @@
 
 """Kubernetes API client for storage operations."""
 
-from typing import Optional, List
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, List, Set, Tuple, Union
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
+import orjson
+from .reflector_cache import ReflectorCache
+
+
+# TTLs (seconds) for slowly-changing resources
+STORAGE_CLASS_CACHE_TTL = 60
+QUOTA_CACHE_TTL = 15
+QUOTA_CACHE_MAXSIZE = 256
+
+# Sized for the analyzer's thread fan-out (urllib3 defaults to cpu_count * 5)
+CONNECTION_POOL_MAXSIZE = 32
+
+# (API group, resource) needed with the "list" verb for each permission flag
+PERMISSION_RESOURCES = {
+    "can_list_namespaces": ("", "namespaces"),
+    "can_list_pvcs": ("", "persistentvolumeclaims"),
+    "can_list_pods": ("", "pods"),
+    "can_list_storage_classes": ("storage.k8s.io", "storageclasses"),
+    "can_list_resource_quotas": ("", "resourcequotas"),
+}
+
+# Permission flags for cluster-scoped resources; a namespaced
+# SelfSubjectRulesReview cannot answer these
+CLUSTER_SCOPED_PERMISSIONS = frozenset({"can_list_namespaces", "can_list_storage_classes"})
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an RFC 3339 timestamp from a raw API object."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _rules_allow(rules: List[Any], api_group: str, resource: str, verb: str) -> bool:
+    """Check whether SelfSubjectRulesReview resource rules grant a verb.
+    
+    Args:
+        rules: ResourceRule objects from the review status
+        api_group: API group of the resource ("" for core)
+        resource: Plural resource name
+        verb: Verb to check (e.g. "list")
+        
+    Returns:
+        True if any rule grants the verb on the resource
+    """
+    for rule in rules:
+        if rule.resource_names:
+            # Limited to named objects; does not grant list/watch
+            continue
+        if not ({"*", verb} & set(rule.verbs or [])):
+            continue
+        if not ({"*", api_group} & set(rule.api_groups or [])):
+            continue
+        if {"*", resource} & set(rule.resources or []):
+            return True
+    return False
+
+
+def _namespace_from_model(ns: Any) -> dict:
+    """Project a V1Namespace to a namespace dict."""
+    return {
+        "name": ns.metadata.name,
+        "creation_timestamp": ns.metadata.creation_timestamp,
+        "labels": ns.metadata.labels or {},
+        "status": ns.status.phase
+    }
+
+
+def _pvc_from_model(pvc: Any) -> dict:
+    """Project a V1PersistentVolumeClaim to a PVC dict (without annotations)."""
+    return {
+        "name": pvc.metadata.name,
+        "namespace": pvc.metadata.namespace,
+        "status": pvc.status.phase,
+        "capacity": pvc.status.capacity.get("storage") if pvc.status.capacity else None,
+        "storage_class": pvc.spec.storage_class_name,
+        "access_modes": pvc.spec.access_modes or [],
+        "volume_name": pvc.spec.volume_name,
+        "creation_timestamp": pvc.metadata.creation_timestamp,
+        "labels": pvc.metadata.labels or {},
+    }
+
+
+def _pod_from_model(pod: Any) -> dict:
+    """Project a V1Pod to a pod dict with its PVC claim names."""
+    pvc_claims = []
+    if pod.spec.volumes:
+        for volume in pod.spec.volumes:
+            if volume.persistent_volume_claim:
+                pvc_claims.append(volume.persistent_volume_claim.claim_name)
+    
+    return {
+        "name": pod.metadata.name,
+        "namespace": pod.metadata.namespace,
+        "status": pod.status.phase,
+        "node_name": pod.spec.node_name,
+        "pvc_claims": pvc_claims,
+        "creation_timestamp": pod.metadata.creation_timestamp,
+        "labels": pod.metadata.labels or {},
+    }
+
+
+def _storage_class_from_model(sc: Any) -> dict:
+    """Project a V1StorageClass to a storage class dict."""
+    return {
+        "name": sc.metadata.name,
+        "provisioner": sc.provisioner,
+        "reclaim_policy": sc.reclaim_policy,
+        "volume_binding_mode": sc.volume_binding_mode,
+        "allow_volume_expansion": sc.allow_volume_expansion or False,
+        "parameters": sc.parameters or {},
+    }
+
+
+def _quota_from_model(quota: Any) -> dict:
+    """Project a V1ResourceQuota to a resource quota dict."""
+    status = quota.status
+    return {
+        "name": quota.metadata.name,
+        "namespace": quota.metadata.namespace,
+        "resource_version": quota.metadata.resource_version,
+        "hard_limits": dict(status.hard or {}) if status else {},
+        "used": dict(status.used or {}) if status else {},
+    }
+
+
+def _quota_dict(quota: dict) -> dict:
+    """Project a raw ResourceQuota JSON object to a resource quota dict."""
+    metadata = quota["metadata"]
+    status = quota.get("status") or {}
+    return {
+        "name": metadata["name"],
+        "namespace": metadata.get("namespace"),
+        "resource_version": metadata.get("resourceVersion"),
+        "hard_limits": status.get("hard") or {},
+        "used": status.get("used") or {},
+    }
 
 
 class K8sClient:
@@ -25,20 +166,60 @@ class K8sClient:
     
     Provides read-only access to storage resources (PVCs, Pods, StorageClasses, Quotas).
     Automatically handles kubeconfig loading and in-cluster configuration.
+    
+    With use_cache=True (long-running API server), list calls are served from
+    watch-backed ReflectorCache stores instead of hitting the API server on
+    every call. The stores keep projected dicts, not API models, and
+    cache_namespace_prefix limits them to the namespaces the tool reports
+    on. One-shot CLI invocations leave caching disabled.
     """
     
-    def __init__(self, kubeconfig_path: Optional[str] = None, context: Optional[str] = None):
+    def __init__(
+        self,
+        kubeconfig_path: Optional[str] = None,
+        context: Optional[str] = None,
+        use_cache: bool = False,
+        consistent_read: bool = False,
+        quota_label_selector: Optional[str] = None,
+        cache_namespace_prefix: Optional[Union[str, Tuple[str, ...]]] = None
+    ):
         """Initialize Kubernetes client.
         
         Args:
             kubeconfig_path: Path to kubeconfig file (default: ~/.kube/config)
             context: Kubernetes context to use (default: current context)
+            use_cache: Serve list calls from list+watch caches
+            consistent_read: Read lists from etcd (quorum read) instead of
+                the API server watch cache (resourceVersion="0")
+            quota_label_selector: Default label selector for resource quota
+                lists, e.g. "runai.io/quota-kind in (storage,combined)" where
+                storage quotas are labelled, so compute/GPU quotas are
+                filtered server-side
+            cache_namespace_prefix: With use_cache, only namespaces with this
+                name prefix (or tuple of prefixes) are mirrored by the
+                cluster-wide PVC, pod and quota caches; other namespaces are
+                listed from the API on each call (all mirrored if None)
         """
         self.kubeconfig_path = kubeconfig_path
         self.context = context
+        self.use_cache = use_cache
+        self.consistent_read = consistent_read
+        self.quota_label_selector = quota_label_selector
+        self.cache_namespace_prefix = cache_namespace_prefix
         self._core_v1 = None
         self._storage_v1 = None
+        self._authorization_v1 = None
         self._initialized = False
+        self._caches: Dict[Tuple[str, Optional[str], Optional[str]], ReflectorCache] = {}
+        self._caches_lock = threading.Lock()
+        # Kinds whose cluster-wide list is forbidden (403); those are then
+        # cached per namespace instead
+        self._cluster_list_forbidden: Set[str] = set()
+        self._storage_class_cache: Optional[Tuple[float, List[dict]]] = None
+        self._quota_cache: Dict[Tuple[str, Optional[str]], Tuple[float, List[dict]]] = {}
+        self._ttl_lock = threading.Lock()
+        # Long-lived pool for concurrent API reads, created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
     
     def _ensure_initialized(self):
         """Lazy initialization of K8s API clients."""
@@ -54,8 +235,13 @@ class K8sClient:
                 except config.ConfigException:
                     config.load_kube_config(context=self.context)
             
-            self._core_v1 = client.CoreV1Api()
-            self._storage_v1 = client.StorageV1Api()
+            configuration = client.Configuration.get_default_copy()
+            configuration.connection_pool_maxsize = CONNECTION_POOL_MAXSIZE
+            api_client = client.ApiClient(configuration)
+            
+            self._core_v1 = client.CoreV1Api(api_client)
+            self._storage_v1 = client.StorageV1Api(api_client)
+            self._authorization_v1 = client.AuthorizationV1Api(api_client)
             self._initialized = True
             
         except Exception as e:
@@ -73,6 +259,185 @@ class K8sClient:
         self._ensure_initialized()
         return self._storage_v1
     
+    @property
+    def authorization_v1(self) -> client.AuthorizationV1Api:
+        """Get AuthorizationV1Api client."""
+        self._ensure_initialized()
+        return self._authorization_v1
+    
+    def serves_from_cache(self, namespace: str) -> bool:
+        """Check whether a namespace's PVC, pod and quota lists are cached.
+        
+        Cached reads are in-memory and need no concurrent fan-out.
+        
+        Args:
+            namespace: Kubernetes namespace
+            
+        Returns:
+            True if use_cache is on and the namespace is mirrored
+        """
+        if not self.use_cache:
+            return False
+        return self.cache_namespace_prefix is None or namespace.startswith(self.cache_namespace_prefix)
+    
+    def _in_cached_namespace(self, namespace: Optional[str]) -> bool:
+        """Namespace filter for the cluster-wide reflector caches."""
+        return namespace is not None and namespace.startswith(self.cache_namespace_prefix)
+    
+    def _list_items(
+        self,
+        kind: str,
+        list_func: Callable,
+        project: Callable[[Any], dict],
+        namespace: Optional[str] = None,
+        label_selector: Optional[str] = None
+    ) -> List[dict]:
+        """List API objects as projected dicts, from the reflector cache when enabled.
+        
+        Args:
+            kind: Resource kind used as cache key
+            list_func: Kubernetes client list function
+            project: Converts an API model object to its dict
+            namespace: Namespace for namespaced resources
+            label_selector: Optional label selector
+            
+        Returns:
+            List of projected dictionaries
+        """
+        args = (namespace,) if namespace is not None else ()
+        kwargs = {"label_selector": label_selector} if label_selector else {}
+        
+        if not self.use_cache:
+            if not self.consistent_read:
+                # Served from the API server watch cache, skipping etcd
+                kwargs["resource_version"] = "0"
+            return [project(obj) for obj in list_func(*args, **kwargs).items]
+        
+        return self._get_cache((kind, namespace, label_selector), list_func, project, *args, **kwargs).list()
+    
+    def _get_cache(self, key: Tuple[str, Optional[str], Optional[str]], list_func: Callable,
+                   project: Callable[[Any], dict], *args: Any,
+                   namespace_filter: Optional[Callable[[Optional[str]], bool]] = None,
+                   **kwargs: Any) -> ReflectorCache:
+        """Get or create the reflector cache for a key."""
+        with self._caches_lock:
+            cache = self._caches.get(key)
+            if cache is None:
+                cache = self._caches[key] = ReflectorCache(
+                    list_func, *args, project=project, namespace_filter=namespace_filter, **kwargs
+                )
+        return cache
+    
+    def _list_namespaced_items(
+        self,
+        kind: str,
+        list_func: Callable,
+        list_all_func: Callable,
+        project: Callable[[Any], dict],
+        namespace: str,
+        label_selector: Optional[str] = None
+    ) -> List[dict]:
+        """List a namespaced resource in one namespace from the reflector caches.
+        
+        Callers check serves_from_cache(namespace) first. All mirrored
+        namespaces share one cluster-wide reflector per kind (indexed by
+        namespace, limited to cache_namespace_prefix), so the number of
+        watch threads and connections does not grow with the number of
+        namespaces analyzed. If the cluster-wide list is forbidden, the kind
+        falls back to per-namespace reflectors.
+        
+        Args:
+            kind: Resource kind used as cache key
+            list_func: Namespaced list function (e.g. list_namespaced_pod)
+            list_all_func: Cluster-wide list function (e.g. list_pod_for_all_namespaces)
+            project: Converts an API model object to its dict
+            namespace: Kubernetes namespace
+            label_selector: Optional label selector
+            
+        Returns:
+            List of projected dictionaries
+        """
+        if kind not in self._cluster_list_forbidden:
+            key = (kind, None, label_selector)
+            kwargs = {"label_selector": label_selector} if label_selector else {}
+            if self.cache_namespace_prefix is not None:
+                kwargs["namespace_filter"] = self._in_cached_namespace
+            cache = self._get_cache(key, list_all_func, project, **kwargs)
+            try:
+                return cache.list(namespace)
+            except ApiException as e:
+                if e.status != 403:
+                    raise
+                self._cluster_list_forbidden.add(kind)
+                with self._caches_lock:
+                    self._caches.pop(key, None)
+        
+        return self._list_items(kind, list_func, project, namespace, label_selector)
+    
+    def _list_raw_items(
+        self,
+        list_func: Callable,
+        namespace: Optional[str],
+        label_selector: Optional[str] = None
+    ) -> List[dict]:
+        """List objects as plain JSON dicts, bypassing model deserialization.
+        
+        Args:
+            list_func: Kubernetes client list function
+            namespace: Namespace to list (None for cluster-wide list functions)
+            label_selector: Optional label selector
+            
+        Returns:
+            List of raw API object dictionaries
+        """
+        args = (namespace,) if namespace is not None else ()
+        kwargs = {} if self.consistent_read else {"resource_version": "0"}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+        response = list_func(*args, _preload_content=False, **kwargs)
+        return orjson.loads(response.data)["items"]
+    
+    def submit(self, func: Callable, *args: Any) -> Future:
+        """Run a blocking call on the client's shared worker pool.
+        
+        The pool is sized to the connection pool and reused across calls,
+        so concurrent reads do not create and tear down threads per request.
+        Submitted calls must not wait on other submitted calls.
+        
+        Args:
+            func: Callable to run
+            *args: Arguments passed to func
+            
+        Returns:
+            Future for func(*args)
+        """
+        with self._caches_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=CONNECTION_POOL_MAXSIZE,
+                    thread_name_prefix="k8s-read"
+                )
+            executor = self._executor
+        return executor.submit(func, *args)
+    
+    def invalidate_cache(self):
+        """Drop TTL-cached storage classes and resource quotas."""
+        with self._ttl_lock:
+            self._storage_class_cache = None
+            self._quota_cache.clear()
+    
+    def close(self):
+        """Stop all reflector cache watches and the shared worker pool."""
+        with self._caches_lock:
+            caches = list(self._caches.values())
+            self._caches.clear()
+            executor, self._executor = self._executor, None
+        
+        for cache in caches:
+            cache.stop()
+        if executor is not None:
+            executor.shutdown(wait=False)
+    
     def list_namespaces(self, label_selector: Optional[str] = None) -> List[dict]:
         """List all namespaces (or filtered by labels).
         
@@ -83,53 +448,62 @@ class K8sClient:
             List of namespace dictionaries with name and metadata
         """
         try:
-            if label_selector:
-                namespaces = self.core_v1.list_namespace(label_selector=label_selector)
-            else:
-                namespaces = self.core_v1.list_namespace()
-            
-            return [
-                {
-                    "name": ns.metadata.name,
-                    "creation_timestamp": ns.metadata.creation_timestamp,
-                    "labels": ns.metadata.labels or {},
-                    "status": ns.status.phase
-                }
-                for ns in namespaces.items
-            ]
+            return self._list_items(
+                "namespaces", self.core_v1.list_namespace, _namespace_from_model, label_selector=label_selector
+            )
         except ApiException as e:
             raise RuntimeError(f"Failed to list namespaces: {e}")
     
-    def list_pvcs(self, namespace: str) -> List[dict]:
+    def list_pvcs(self, namespace: str, include_annotations: bool = False) -> List[dict]:
         """List all PVCs in a namespace.
         
         Args:
             namespace: Kubernetes namespace
+            include_annotations: Include the annotations map (omitted by
+                default; it is often large and unused by the analysis)
             
         Returns:
             List of PVC dictionaries with detailed information
         """
         try:
-            pvcs = self.core_v1.list_namespaced_persistent_volume_claim(namespace)
+            # The caches do not keep annotations; list those from the API
+            if include_annotations or not self.serves_from_cache(namespace):
+                return self._list_pvcs_raw(namespace, include_annotations)
             
-            return [
-                {
-                    "name": pvc.metadata.name,
-                    "namespace": pvc.metadata.namespace,
-                    "status": pvc.status.phase,
-                    "capacity": pvc.status.capacity.get("storage") if pvc.status.capacity else None,
-                    "storage_class": pvc.spec.storage_class_name,
-                    "access_modes": pvc.spec.access_modes or [],
-                    "volume_name": pvc.spec.volume_name,
-                    "creation_timestamp": pvc.metadata.creation_timestamp,
-                    "labels": pvc.metadata.labels or {},
-                    "annotations": pvc.metadata.annotations or {},
-                }
-                for pvc in pvcs.items
-            ]
+            return self._list_namespaced_items(
+                "pvcs",
+                self.core_v1.list_namespaced_persistent_volume_claim,
+                self.core_v1.list_persistent_volume_claim_for_all_namespaces,
+                _pvc_from_model,
+                namespace
+            )
         except ApiException as e:
             raise RuntimeError(f"Failed to list PVCs in namespace {namespace}: {e}")
     
+    def _list_pvcs_raw(self, namespace: str, include_annotations: bool) -> List[dict]:
+        """Project PVC dicts straight from the raw JSON list response."""
+        result = []
+        for pvc in self._list_raw_items(self.core_v1.list_namespaced_persistent_volume_claim, namespace):
+            metadata = pvc["metadata"]
+            spec = pvc.get("spec") or {}
+            status = pvc.get("status") or {}
+            pvc_dict = {
+                "name": metadata["name"],
+                "namespace": metadata.get("namespace"),
+                "status": status.get("phase"),
+                "capacity": (status.get("capacity") or {}).get("storage"),
+                "storage_class": spec.get("storageClassName"),
+                "access_modes": spec.get("accessModes") or [],
+                "volume_name": spec.get("volumeName"),
+                "creation_timestamp": _parse_timestamp(metadata.get("creationTimestamp")),
+                "labels": metadata.get("labels") or {},
+            }
+            if include_annotations:
+                pvc_dict["annotations"] = metadata.get("annotations") or {}
+            result.append(pvc_dict)
+        
+        return result
+    
     def list_pods(self, namespace: str) -> List[dict]:
         """List all pods in a namespace.
         
@@ -140,80 +514,242 @@ class K8sClient:
             List of pod dictionaries with PVC mount information
         """
         try:
-            pods = self.core_v1.list_namespaced_pod(namespace)
-            
-            result = []
-            for pod in pods.items:
-                pvc_claims = []
-                if pod.spec.volumes:
-                    for volume in pod.spec.volumes:
-                        if volume.persistent_volume_claim:
-                            pvc_claims.append(volume.persistent_volume_claim.claim_name)
-                
-                result.append({
-                    "name": pod.metadata.name,
-                    "namespace": pod.metadata.namespace,
-                    "status": pod.status.phase,
-                    "node_name": pod.spec.node_name,
-                    "pvc_claims": pvc_claims,
-                    "creation_timestamp": pod.metadata.creation_timestamp,
-                    "labels": pod.metadata.labels or {},
-                })
+            if not self.serves_from_cache(namespace):
+                return self._list_pods_raw(namespace)
             
-            return result
+            return self._list_namespaced_items(
+                "pods",
+                self.core_v1.list_namespaced_pod,
+                self.core_v1.list_pod_for_all_namespaces,
+                _pod_from_model,
+                namespace
+            )
         except ApiException as e:
             raise RuntimeError(f"Failed to list pods in namespace {namespace}: {e}")
     
+    def _list_pods_raw(self, namespace: str) -> List[dict]:
+        """Project pod dicts straight from the raw JSON list response."""
+        result = []
+        for pod in self._list_raw_items(self.core_v1.list_namespaced_pod, namespace):
+            metadata = pod["metadata"]
+            spec = pod.get("spec") or {}
+            result.append({
+                "name": metadata["name"],
+                "namespace": metadata.get("namespace"),
+                "status": (pod.get("status") or {}).get("phase"),
+                "node_name": spec.get("nodeName"),
+                "pvc_claims": [
+                    volume["persistentVolumeClaim"]["claimName"]
+                    for volume in spec.get("volumes") or []
+                    if "persistentVolumeClaim" in volume
+                ],
+                "creation_timestamp": _parse_timestamp(metadata.get("creationTimestamp")),
+                "labels": metadata.get("labels") or {},
+            })
+        
+        return result
+    
+    def list_pvcs_pods_quotas(self, namespace: str) -> Tuple[List[dict], List[dict], List[dict]]:
+        """List PVCs, pods and resource quotas of a namespace concurrently.
+        
+        Lists served from the reflector caches (serves_from_cache) are
+        in-memory reads and are made in the calling thread instead.
+        
+        Args:
+            namespace: Kubernetes namespace
+            
+        Returns:
+            Tuple of (PVC dicts, pod dicts, resource quota dicts)
+        """
+        if self.serves_from_cache(namespace):
+            return self.list_pvcs(namespace), self.list_pods(namespace), self.list_resource_quotas(namespace)
+        
+        pods_future = self.submit(self.list_pods, namespace)
+        quotas_future = self.submit(self.list_resource_quotas, namespace)
+        return self.list_pvcs(namespace), pods_future.result(), quotas_future.result()
+    
     def list_storage_classes(self) -> List[dict]:
-        """List all storage classes in the cluster.
+        """List all storage classes in the cluster (cached for 60s).
         
         Returns:
             List of storage class dictionaries
         """
+        now = time.monotonic()
+        with self._ttl_lock:
+            cached = self._storage_class_cache
+        if cached is not None and now - cached[0] < STORAGE_CLASS_CACHE_TTL:
+            return cached[1]
+        
+        storage_classes = self._list_storage_classes()
+        with self._ttl_lock:
+            self._storage_class_cache = (now, storage_classes)
+        return storage_classes
+    
+    def _list_storage_classes(self) -> List[dict]:
+        """List all storage classes from the API (uncached)."""
         try:
-            storage_classes = self.storage_v1.list_storage_class()
-            
-            return [
-                {
-                    "name": sc.metadata.name,
-                    "provisioner": sc.provisioner,
-                    "reclaim_policy": sc.reclaim_policy,
-                    "volume_binding_mode": sc.volume_binding_mode,
-                    "allow_volume_expansion": sc.allow_volume_expansion or False,
-                    "parameters": sc.parameters or {},
-                }
-                for sc in storage_classes.items
-            ]
+            return self._list_items("storageclasses", self.storage_v1.list_storage_class, _storage_class_from_model)
         except ApiException as e:
             raise RuntimeError(f"Failed to list storage classes: {e}")
     
-    def list_resource_quotas(self, namespace: str) -> List[dict]:
-        """List resource quotas in a namespace.
+    def list_resource_quotas(self, namespace: str, label_selector: Optional[str] = None) -> List[dict]:
+        """List resource quotas in a namespace (cached for 15s).
+        
+        Quotas of namespaces served from the watch-backed reflector store
+        (serves_from_cache) are always current, so the TTL cache is skipped.
         
         Args:
             namespace: Kubernetes namespace
+            label_selector: Label selector applied server-side (defaults to
+                the client's quota_label_selector)
             
         Returns:
             List of resource quota dictionaries
         """
+        label_selector = label_selector or self.quota_label_selector
+        if self.serves_from_cache(namespace):
+            return self._list_resource_quotas(namespace, label_selector)
+        
+        key = (namespace, label_selector)
+        now = time.monotonic()
+        with self._ttl_lock:
+            cached = self._quota_cache.get(key)
+        if cached is not None and now - cached[0] < QUOTA_CACHE_TTL:
+            return cached[1]
+        
+        quotas = self._list_resource_quotas(namespace, label_selector)
+        with self._ttl_lock:
+            self._quota_cache.pop(key, None)
+            if len(self._quota_cache) >= QUOTA_CACHE_MAXSIZE:
+                # Evict the oldest insertion (dicts keep insertion order)
+                self._quota_cache.pop(next(iter(self._quota_cache)))
+            self._quota_cache[key] = (now, quotas)
+        return quotas
+    
+    def _list_resource_quotas(self, namespace: str, label_selector: Optional[str] = None) -> List[dict]:
+        """List resource quotas in a namespace from the API (uncached)."""
         try:
-            quotas = self.core_v1.list_namespaced_resource_quota(namespace)
+            if not self.serves_from_cache(namespace):
+                return self._list_resource_quotas_raw(namespace, label_selector)
             
-            return [
-                {
-                    "name": quota.metadata.name,
-                    "namespace": quota.metadata.namespace,
-                    "hard_limits": dict(quota.status.hard or {}),
-                    "used": dict(quota.status.used or {}),
-                }
-                for quota in quotas.items
-            ]
+            return self._list_namespaced_items(
+                "resourcequotas",
+                self.core_v1.list_namespaced_resource_quota,
+                self.core_v1.list_resource_quota_for_all_namespaces,
+                _quota_from_model,
+                namespace,
+                label_selector
+            )
         except ApiException as e:
             raise RuntimeError(f"Failed to list resource quotas in namespace {namespace}: {e}")
     
+    def _list_resource_quotas_raw(self, namespace: str, label_selector: Optional[str] = None) -> List[dict]:
+        """Project resource quota dicts straight from the raw JSON list response."""
+        quotas = self._list_raw_items(self.core_v1.list_namespaced_resource_quota, namespace, label_selector)
+        return [_quota_dict(quota) for quota in quotas]
+    
+    def list_resource_quotas_by_namespace(
+        self,
+        namespaces: List[str],
+        label_selector: Optional[str] = None
+    ) -> Dict[str, List[dict]]:
+        """List resource quotas of several namespaces with one cluster-wide call.
+        
+        Without use_cache a single list_resource_quota_for_all_namespaces call
+        replaces one call per namespace; if it is forbidden, the namespaces
+        are listed concurrently instead.
+        
+        Args:
+            namespaces: Kubernetes namespaces
+            label_selector: Label selector applied server-side (defaults to
+                the client's quota_label_selector)
+            
+        Returns:
+            Mapping of namespace to resource quota dictionaries
+        """
+        label_selector = label_selector or self.quota_label_selector
+        if self.use_cache:
+            return {ns: self.list_resource_quotas(ns, label_selector) for ns in namespaces}
+        
+        try:
+            quotas = self._list_raw_items(
+                self.core_v1.list_resource_quota_for_all_namespaces, None, label_selector
+            )
+        except ApiException as e:
+            if e.status != 403:
+                raise RuntimeError(f"Failed to list resource quotas: {e}")
+            
+            futures = [self.submit(self.list_resource_quotas, ns, label_selector) for ns in namespaces]
+            return {ns: future.result() for ns, future in zip(namespaces, futures)}
+        
+        by_namespace: Dict[str, List[dict]] = {ns: [] for ns in namespaces}
+        for quota in quotas:
+            bucket = by_namespace.get(quota["metadata"].get("namespace"))
+            if bucket is not None:
+                bucket.append(_quota_dict(quota))
+        return by_namespace
+    
+    def _probe_list_permission(self, permission: str) -> bool:
+        """Check a permission by issuing a limit=1 list call.
+        
+        Args:
+            permission: Key from PERMISSION_RESOURCES
+            
+        Returns:
+            True if the list call succeeded
+        """
+        probes = {
+            "can_list_namespaces": lambda: self.core_v1.list_namespace(
+                _preload_content=False, limit=1),
+            "can_list_pvcs": lambda: self.core_v1.list_namespaced_persistent_volume_claim(
+                "default", _preload_content=False, limit=1),
+            "can_list_pods": lambda: self.core_v1.list_namespaced_pod(
+                "default", _preload_content=False, limit=1),
+            "can_list_storage_classes": lambda: self.storage_v1.list_storage_class(
+                _preload_content=False, limit=1),
+            "can_list_resource_quotas": lambda: self.core_v1.list_namespaced_resource_quota(
+                "default", _preload_content=False, limit=1),
+        }
+        try:
+            probes[permission]()
+            return True
+        except ApiException:
+            return False
+    
+    def _access_review_allows(self, api_group: str, resource: str, verb: str) -> bool:
+        """Ask the API server whether a verb is allowed cluster-wide.
+        
+        Args:
+            api_group: API group of the resource ("" for core)
+            resource: Plural resource name
+            verb: Verb to check (e.g. "list")
+            
+        Returns:
+            True if a SelfSubjectAccessReview allows the verb
+            
+        Raises:
+            ApiException: If the review cannot be created
+        """
+        review = self.authorization_v1.create_self_subject_access_review(
+            body=client.V1SelfSubjectAccessReview(
+                spec=client.V1SelfSubjectAccessReviewSpec(
+                    resource_attributes=client.V1ResourceAttributes(
+                        group=api_group, resource=resource, verb=verb
+                    )
+                )
+            )
+        )
+        return bool(review.status.allowed)
+    
     def check_permissions(self) -> dict:
         """Check what permissions the current user has.
         
+        Namespaced permissions come from a single SelfSubjectRulesReview for
+        the "default" namespace; cluster-scoped ones (namespaces, storage
+        classes) from one SelfSubjectAccessReview each. Permissions a review
+        cannot confirm (review unavailable, or rules reported incomplete)
+        are verified with limit=1 list probes.
+        
         Returns:
             Dictionary with permission check results
         """
@@ -230,40 +766,36 @@ class K8sClient:
         try:
             self._ensure_initialized()
             
-            # Test namespace listing
-            try:
-                self.core_v1.list_namespace(_preload_content=False, limit=1)
-                permissions["can_list_namespaces"] = True
-            except ApiException:
-                pass
+            # Permissions whose False result is authoritative
+            decided = set()
             
-            # Test PVC listing (need a namespace, try default)
             try:
-                self.core_v1.list_namespaced_persistent_volume_claim("default", _preload_content=False, limit=1)
-                permissions["can_list_pvcs"] = True
+                review = self.authorization_v1.create_self_subject_rules_review(
+                    body=client.V1SelfSubjectRulesReview(
+                        spec=client.V1SelfSubjectRulesReviewSpec(namespace="default")
+                    )
+                )
+                rules = review.status.resource_rules or []
+                for permission, (api_group, resource) in PERMISSION_RESOURCES.items():
+                    if permission in CLUSTER_SCOPED_PERMISSIONS:
+                        continue
+                    permissions[permission] = _rules_allow(rules, api_group, resource, "list")
+                    if not review.status.incomplete:
+                        decided.add(permission)
             except ApiException:
                 pass
             
-            # Test Pod listing
-            try:
-                self.core_v1.list_namespaced_pod("default", _preload_content=False, limit=1)
-                permissions["can_list_pods"] = True
-            except ApiException:
-                pass
-            
-            # Test StorageClass listing
-            try:
-                self.storage_v1.list_storage_class(_preload_content=False, limit=1)
-                permissions["can_list_storage_classes"] = True
-            except ApiException:
-                pass
+            for permission in CLUSTER_SCOPED_PERMISSIONS:
+                api_group, resource = PERMISSION_RESOURCES[permission]
+                try:
+                    permissions[permission] = self._access_review_allows(api_group, resource, "list")
+                    decided.add(permission)
+                except ApiException:
+                    pass
             
-            # Test ResourceQuota listing
-            try:
-                self.core_v1.list_namespaced_resource_quota("default", _preload_content=False, limit=1)
-                permissions["can_list_resource_quotas"] = True
-            except ApiException:
-                pass
+            for permission in PERMISSION_RESOURCES:
+                if not permissions[permission] and permission not in decided:
+                    permissions[permission] = self._probe_list_permission(permission)
             
         except Exception as e:
             permissions["error_message"] = str(e)
@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Request-scoped memo of a namespace's Kubernetes list calls."""
+
+import threading
+from typing import Callable, Dict, List, Optional
+from .k8s_client import K8sClient
+
+
+class NamespaceSnapshot:
+    """PVC, pod and resource quota lists of one namespace, fetched at most once.
+    
+    Services accept an optional snapshot so that a single analysis (or
+    request) shares one list call per resource instead of each service
+    listing it again. Lists are fetched lazily on first access, or all
+    together with prefetch().
+    """
+    
+    def __init__(
+        self,
+        k8s_client: K8sClient,
+        namespace: str,
+        quotas: Optional[List[dict]] = None
+    ):
+        """Create a snapshot.
+        
+        Args:
+            k8s_client: Kubernetes API client
+            namespace: Kubernetes namespace
+            quotas: Resource quota dicts already fetched for the namespace
+                (e.g. by a cluster-wide list); listed on demand if None
+        """
+        self.k8s = k8s_client
+        self.namespace = namespace
+        self._lists: Dict[str, List[dict]] = {}
+        if quotas is not None:
+            self._lists["quotas"] = quotas
+        self._lock = threading.Lock()
+    
+    def _store(self, kind: str, items: List[dict]) -> List[dict]:
+        """Store a fetched list unless another thread stored one first."""
+        with self._lock:
+            return self._lists.setdefault(kind, items)
+    
+    def _get(self, kind: str, list_func: Callable[[str], List[dict]]) -> List[dict]:
+        """Get a list, fetching it on first access."""
+        with self._lock:
+            items = self._lists.get(kind)
+        if items is None:
+            items = self._store(kind, list_func(self.namespace))
+        return items
+    
+    def prefetch(self) -> "NamespaceSnapshot":
+        """Fetch PVCs, pods and resource quotas concurrently.
+        
+        Quotas passed to the constructor are not fetched again. Lists served
+        from the client's reflector caches (serves_from_cache) are read in
+        the calling thread.
+        
+        Returns:
+            This snapshot
+        """
+        with self._lock:
+            has_quotas = "quotas" in self._lists
+        if has_quotas:
+            if self.k8s.serves_from_cache(self.namespace):
+                self._store("pvcs", self.k8s.list_pvcs(self.namespace))
+                self._store("pods", self.k8s.list_pods(self.namespace))
+                return self
+            
+            pods_future = self.k8s.submit(self.k8s.list_pods, self.namespace)
+            self._store("pvcs", self.k8s.list_pvcs(self.namespace))
+            self._store("pods", pods_future.result())
+            return self
+        
+        pvcs, pods, quotas = self.k8s.list_pvcs_pods_quotas(self.namespace)
+        self._store("pvcs", pvcs)
+        self._store("pods", pods)
+        self._store("quotas", quotas)
+        return self
+    
+    @property
+    def pvcs(self) -> List[dict]:
+        """PVC dicts (see K8sClient.list_pvcs)."""
+        return self._get("pvcs", self.k8s.list_pvcs)
+    
+    @property
+    def pods(self) -> List[dict]:
+        """Pod dicts (see K8sClient.list_pods)."""
+        return self._get("pods", self.k8s.list_pods)
+    
+    @property
+    def quotas(self) -> List[dict]:
+        """Resource quota dicts (see K8sClient.list_resource_quotas)."""
+        return self._get("quotas", self.k8s.list_resource_quotas)
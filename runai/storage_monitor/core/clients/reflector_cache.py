@@ -0,0 +1,228 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Watch-backed in-process cache for Kubernetes list endpoints."""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+
+
+logger = logging.getLogger(__name__)
+
+# Server-side watch timeout; the watch is re-opened from the last seen
+# resourceVersion when it expires
+WATCH_TIMEOUT_SECONDS = 300
+
+# Delay before re-opening a watch after an unexpected error
+WATCH_RETRY_DELAY_SECONDS = 5.0
+
+# A watch that ends sooner than this without an error (e.g. closed by a
+# proxy) is re-opened only after WATCH_RETRY_DELAY_SECONDS, so a server that
+# keeps dropping watches is not hammered in a tight loop
+MIN_WATCH_DURATION_SECONDS = 1.0
+
+HTTP_GONE = 410
+HTTP_GATEWAY_TIMEOUT = 504
+
+
+def _needs_relist(error: ApiException) -> bool:
+    """Check whether a watch error means the resourceVersion is unusable.
+    
+    Covers an expired watch window (410 Gone) and a resourceVersion the API
+    server has not caught up with yet (504 "Too large resource version").
+    Errors raised from a watch stream carry the message in ``reason`` and
+    have no body; list errors carry it in ``body``.
+    """
+    if error.status == HTTP_GONE:
+        return True
+    if error.status != HTTP_GATEWAY_TIMEOUT:
+        return False
+    message = f"{error.reason or ''} {error.body or ''}"
+    return "Too large resource version" in message or "ResourceVersionTooLarge" in message
+
+
+class ReflectorCache:
+    """List+watch mirror of one Kubernetes list endpoint.
+    
+    The first access lists the resource with ``resource_version="0"`` (served
+    from the API server watch cache), then a daemon thread watches from the
+    returned resourceVersion and applies ADDED/MODIFIED/DELETED events to an
+    in-memory store keyed by object UID and indexed by namespace. Expired
+    watches (410 Gone) and too-new resourceVersions trigger a full re-list.
+    
+    Objects are stored as returned by ``project`` (e.g. a small dict), so the
+    full API models are not kept alive; ``namespace_filter`` limits which
+    namespaces of a cluster-wide list are stored at all.
+    """
+    
+    def __init__(
+        self,
+        list_func: Callable,
+        *args: Any,
+        project: Optional[Callable[[Any], Any]] = None,
+        namespace_filter: Optional[Callable[[Optional[str]], bool]] = None,
+        **kwargs: Any
+    ):
+        """Create a cache for a list endpoint.
+        
+        Args:
+            list_func: Kubernetes client list function (e.g.
+                ``CoreV1Api.list_namespaced_pod``)
+            *args: Positional arguments for list_func (e.g. namespace)
+            project: Converts each API object to the stored value (objects
+                are stored unchanged if None)
+            namespace_filter: Returns False for namespaces whose objects are
+                not stored (all are stored if None)
+            **kwargs: Keyword arguments for list_func (e.g. label_selector)
+        """
+        self._list_func = list_func
+        self._args = args
+        self._kwargs = kwargs
+        self._project = project
+        self._namespace_filter = namespace_filter
+        self._items: Dict[str, Any] = {}
+        # namespace -> {uid: object}, for cluster-wide lists read per namespace
+        self._by_namespace: Dict[Optional[str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._watch: Optional[watch.Watch] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    def _relist(self) -> str:
+        """Replace the store with a fresh list and return its resourceVersion."""
+        result = self._list_func(*self._args, resource_version="0", **self._kwargs)
+        project = self._project
+        namespace_filter = self._namespace_filter
+        items: Dict[str, Any] = {}
+        by_namespace: Dict[Optional[str], Dict[str, Any]] = {}
+        for obj in result.items:
+            metadata = obj.metadata
+            if namespace_filter is not None and not namespace_filter(metadata.namespace):
+                continue
+            value = obj if project is None else project(obj)
+            items[metadata.uid] = value
+            by_namespace.setdefault(metadata.namespace, {})[metadata.uid] = value
+        with self._lock:
+            self._items = items
+            self._by_namespace = by_namespace
+        return result.metadata.resource_version
+    
+    def start(self):
+        """Perform the initial list and start the watch thread (idempotent).
+        
+        Raises:
+            ApiException: If the initial list fails
+        """
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            
+            resource_version = self._relist()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(resource_version,),
+                name=f"reflector-{self._list_func.__name__}",
+                daemon=True
+            )
+            self._thread.start()
+    
+    def stop(self):
+        """Stop the watch thread."""
+        self._stopped.set()
+        if self._watch is not None:
+            self._watch.stop()
+    
+    def list(self, namespace: Optional[str] = None) -> List[Any]:
+        """Get a snapshot of the cached objects.
+        
+        Args:
+            namespace: Only return objects in this namespace (all if None)
+        
+        Returns:
+            List of stored objects (projected if a project function is set)
+        """
+        self.start()
+        with self._lock:
+            if namespace is None:
+                return list(self._items.values())
+            return list(self._by_namespace.get(namespace, {}).values())
+    
+    def _apply(self, event_type: str, obj: Any):
+        """Apply a single watch event to the store."""
+        uid = obj.metadata.uid
+        if uid is None:
+            # BOOKMARK events only carry a resourceVersion
+            return
+        
+        namespace = obj.metadata.namespace
+        if self._namespace_filter is not None and not self._namespace_filter(namespace):
+            return
+        
+        if event_type != "DELETED" and self._project is not None:
+            obj = self._project(obj)
+        
+        with self._lock:
+            if event_type == "DELETED":
+                self._items.pop(uid, None)
+                in_namespace = self._by_namespace.get(namespace)
+                if in_namespace is not None:
+                    in_namespace.pop(uid, None)
+                    if not in_namespace:
+                        del self._by_namespace[namespace]
+            else:
+                self._items[uid] = obj
+                self._by_namespace.setdefault(namespace, {})[uid] = obj
+    
+    def _run(self, resource_version: str):
+        """Watch loop; keeps the store in sync until stopped."""
+        while not self._stopped.is_set():
+            self._watch = watch.Watch()
+            opened_at = time.monotonic()
+            try:
+                for event in self._watch.stream(
+                    self._list_func,
+                    *self._args,
+                    resource_version=resource_version,
+                    timeout_seconds=WATCH_TIMEOUT_SECONDS,
+                    allow_watch_bookmarks=True,
+                    **self._kwargs
+                ):
+                    obj = event["object"]
+                    resource_version = obj.metadata.resource_version or resource_version
+                    self._apply(event["type"], obj)
+                
+                if time.monotonic() - opened_at < MIN_WATCH_DURATION_SECONDS:
+                    self._stopped.wait(WATCH_RETRY_DELAY_SECONDS)
+            except ApiException as e:
+                if not _needs_relist(e):
+                    logger.warning("Watch on %s failed: %s", self._list_func.__name__, e)
+                    self._stopped.wait(WATCH_RETRY_DELAY_SECONDS)
+                    continue
+                
+                # Watch window expired or resourceVersion not yet served;
+                # rebuild the store from a fresh list
+                try:
+                    resource_version = self._relist()
+                except Exception as relist_error:
+                    logger.warning("Re-list of %s failed: %s", self._list_func.__name__, relist_error)
+                    self._stopped.wait(WATCH_RETRY_DELAY_SECONDS)
+            except Exception as e:
+                logger.warning("Watch on %s failed: %s", self._list_func.__name__, e)
+                self._stopped.wait(WATCH_RETRY_DELAY_SECONDS)
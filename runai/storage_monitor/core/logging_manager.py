@@ -18,13 +18,54 @@
 Tracks all operations across tiers (Core, CLI, MCP, API, GUI)
 """
 
-import logging
+import atexit
+import itertools
 import json
+import queue
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from collections import deque
-from threading import Lock
+from threading import Lock, Thread
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Entries waiting for the background file writer; beyond this they are dropped
+WRITE_QUEUE_SIZE = 10000
+WRITE_BATCH_SIZE = 256
+
+_STOP = object()
+
+
+def _dumps(entry: Dict[str, Any]) -> str:
+    """Serialize a log entry to a JSON line (orjson when available)."""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS accepts int/float/bool/None keys, as json.dumps does
+        return orjson.dumps(entry, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(entry, default=str)
+
+
+def _to_epoch_us(when: datetime) -> int:
+    """Convert a datetime to integer epoch microseconds without float rounding."""
+    return int(when.replace(microsecond=0).timestamp()) * 1_000_000 + when.microsecond
+
+
+def _public_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a stored entry (ts_ns) to its public form (ISO timestamp).
+    
+    The timestamp is truncated to whole microseconds with integer math, so
+    passing it back to get_logs_since excludes the entry exactly.
+    """
+    seconds, micros = divmod(entry['ts_ns'] // 1000, 1_000_000)
+    timestamp = datetime.fromtimestamp(seconds).replace(microsecond=micros)
+    public = {'timestamp': timestamp.isoformat()}
+    public.update((k, v) for k, v in entry.items() if k != 'ts_ns')
+    return public
 
 
 class StructuredLogger:
@@ -32,18 +73,83 @@ class StructuredLogger:
     
     def __init__(self, max_entries: int = 1000):
         self.max_entries = max_entries
+        # Full-buffer readers snapshot without locking: list(deque) and
+        # deque.append/clear each run as a single C call under the CPython GIL.
+        # The lock orders ts_ns stamping with the append for writers and
+        # guards partial (islice) iteration in get_recent_logs.
         self.log_buffer = deque(maxlen=max_entries)
         self.lock = Lock()
         self.state_dir = Path.home() / '.runai-storage-monitor'
         self.log_file = self.state_dir / 'logs' / 'operations.jsonl'
-        self.log_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # Setup file logger
-        self.logger = logging.getLogger('runai_storage_monitor')
-        handler = logging.FileHandler(self.log_file)
-        handler.setFormatter(logging.Formatter('%(message)s'))
-        self.logger.addHandler(handler)
-        self.logger.setLevel(logging.INFO)
+        # File writes happen on a background thread so callers never wait on
+        # disk I/O; entries are appended to the JSONL file in batches. The log
+        # directory, file and thread are created lazily on the first write.
+        self.dropped_entries = 0
+        self._log_fp = None
+        self._write_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._writer: Optional[Thread] = None
+        self._writer_lock = Lock()
+    
+    def _ensure_writer(self):
+        """Lazily create the log file and start the background writer."""
+        if self._writer is not None:
+            return
+        
+        with self._writer_lock:
+            if self._writer is not None:
+                return
+            
+            self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            self._log_fp = open(self.log_file, 'a', buffering=1)
+            writer = Thread(target=self._drain, name='structured-log-writer', daemon=True)
+            writer.start()
+            atexit.register(self.close)
+            self._writer = writer
+    
+    def _drain(self):
+        """Write queued entries to the log file in batches until stopped."""
+        write_queue = self._write_queue
+        while True:
+            entry = write_queue.get()
+            if entry is _STOP:
+                return
+            
+            batch = [entry]
+            stop = False
+            while len(batch) < WRITE_BATCH_SIZE:
+                try:
+                    entry = write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is _STOP:
+                    stop = True
+                    break
+                batch.append(entry)
+            
+            lines = []
+            for e in batch:
+                try:
+                    lines.append(_dumps(_public_entry(e)) + '\n')
+                except (TypeError, ValueError):
+                    # Unserializable entry; drop it rather than the writer
+                    self.dropped_entries += 1
+            
+            try:
+                self._log_fp.write(''.join(lines))
+            except (OSError, ValueError):
+                pass
+            
+            if stop:
+                return
+    
+    def close(self):
+        """Flush queued entries and stop the background writer."""
+        if self._writer is None or not self._writer.is_alive():
+            return
+        self._write_queue.put(_STOP)
+        self._writer.join(timeout=5)
+        self._log_fp.close()
     
     def log_operation(
         self,
@@ -65,8 +171,9 @@ class StructuredLogger:
         Returns:
             Log entry dictionary
         """
+        # Timestamps are formatted lazily on read/write paths
         entry = {
-            'timestamp': datetime.now().isoformat(),
+            'ts_ns': 0,
             'operation': operation,
             'tier': tier,
             'status': status,
@@ -75,10 +182,17 @@ class StructuredLogger:
         }
         
         with self.lock:
+            # Stamped under the lock so the buffer stays ordered by ts_ns
+            entry['ts_ns'] = time.time_ns()
             self.log_buffer.append(entry)
-            self.logger.info(json.dumps(entry))
         
-        return entry
+        self._ensure_writer()
+        try:
+            self._write_queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped_entries += 1
+        
+        return _public_entry(entry)
     
     def log_api_call(
         self,
@@ -210,13 +324,16 @@ class StructuredLogger:
         Returns:
             List of log entry dictionaries
         """
+        # Walk back from the newest entry and stop after `count` matches
+        # instead of copying the whole buffer
         with self.lock:
-            entries = list(self.log_buffer)
+            newest = reversed(self.log_buffer)
+            if tier:
+                newest = (e for e in newest if e['tier'] == tier)
+            entries = list(itertools.islice(newest, max(count, 0)))
         
-        if tier:
-            entries = [e for e in entries if e['tier'] == tier]
-        
-        return entries[-count:]
+        entries.reverse()
+        return [_public_entry(e) for e in entries]
     
     def get_logs_since(self, since: datetime) -> List[Dict]:
         """Get logs since timestamp.
@@ -227,13 +344,21 @@ class StructuredLogger:
         Returns:
             List of log entries after timestamp
         """
-        with self.lock:
-            entries = list(self.log_buffer)
+        # Compared at the microsecond precision of the public timestamps
+        since_us = _to_epoch_us(since)
+        entries = list(self.log_buffer)
+        
+        # Entries are appended in ts_ns order: binary search for the first
+        # entry after since_us (bisect has no key= before Python 3.10)
+        lo, hi = 0, len(entries)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if entries[mid]['ts_ns'] // 1000 <= since_us:
+                lo = mid + 1
+            else:
+                hi = mid
         
-        return [
-            e for e in entries
-            if datetime.fromisoformat(e['timestamp']) > since
-        ]
+        return [_public_entry(e) for e in entries[lo:]]
     
     def clear_logs(self):
         """Clear in-memory log buffer."""
@@ -33,10 +33,9 @@ class NamespaceSummary(BaseModel):
     has_quota: bool = False
     error: Optional[str] = None
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
+    def to_json(self) -> str:
+        """Serialize to JSON in pydantic-core, omitting None fields."""
+        return self.model_dump_json(exclude_none=True)
 
 
 class ClusterOverview(BaseModel):
@@ -50,10 +49,9 @@ class ClusterOverview(BaseModel):
     namespaces_with_quota: int = 0
     timestamp: datetime = Field(default_factory=datetime.now)
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
+    def to_json(self) -> str:
+        """Serialize to JSON in pydantic-core, omitting None fields."""
+        return self.model_dump_json(exclude_none=True)
 
 
 class GraphConfig(BaseModel):
@@ -74,4 +72,8 @@ class GraphData(BaseModel):
     labels: List[str] = Field(default_factory=list)
     datasets: List[Dict[str, Any]] = Field(default_factory=list)
     options: Dict[str, Any] = Field(default_factory=dict)
+    
+    def to_json(self) -> str:
+        """Serialize to JSON in pydantic-core, omitting None fields."""
+        return self.model_dump_json(exclude_none=True)
 
@@ -17,7 +17,7 @@
 
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 
 class PVC(BaseModel):
@@ -35,10 +35,10 @@ class PVC(BaseModel):
     labels: Dict[str, str] = Field(default_factory=dict)
     annotations: Dict[str, str] = Field(default_factory=dict)
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
+    @field_serializer("creation_timestamp", when_used="json-unless-none")
+    def _serialize_creation_timestamp(self, value: datetime) -> str:
+        # Keep "+00:00" offsets (pydantic's native format writes "Z")
+        return value.isoformat()
 
 
 class Pod(BaseModel):
@@ -52,10 +52,10 @@ class Pod(BaseModel):
     creation_timestamp: Optional[datetime] = None
     labels: Dict[str, str] = Field(default_factory=dict)
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
+    @field_serializer("creation_timestamp", when_used="json-unless-none")
+    def _serialize_creation_timestamp(self, value: datetime) -> str:
+        # Keep "+00:00" offsets (pydantic's native format writes "Z")
+        return value.isoformat()
 
 
 class PVCWithPods(BaseModel):
@@ -68,6 +68,13 @@ class PVCWithPods(BaseModel):
     usage_percentage: Optional[float] = None
 
 
+class UnusedPvcsResult(BaseModel):
+    """Unused PVCs in a namespace with their combined capacity."""
+    
+    pvcs: List[PVCWithPods] = Field(default_factory=list)
+    total_capacity_gi: float = 0.0
+
+
 class StorageClass(BaseModel):
     """Storage Class model."""
     
@@ -80,7 +87,12 @@ class StorageClass(BaseModel):
 
 
 class ResourceQuota(BaseModel):
-    """Resource Quota model."""
+    """Resource Quota model.
+    
+    Frozen: QuotaService hands out memoized instances to several callers.
+    """
+    
+    model_config = ConfigDict(frozen=True)
     
     name: str
     namespace: str
@@ -132,10 +144,9 @@ class StorageAnalysis(BaseModel):
     storage_classes: List[StorageClass] = Field(default_factory=list)
     recommendations: List[Recommendation] = Field(default_factory=list)
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
+    def to_json(self) -> str:
+        """Serialize to JSON in pydantic-core, omitting None fields."""
+        return self.model_dump_json(exclude_none=True)
 
 
 class PermissionReport(BaseModel):
@@ -16,11 +16,17 @@
 """Dashboard aggregation service for multi-namespace storage analysis."""
 
 import asyncio
-from typing import List, Optional, Dict, Any, AsyncGenerator
+import bisect
+import heapq
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Optional, Dict, Any, AsyncGenerator, Callable, NamedTuple, Tuple
 from datetime import datetime
 
 from ..clients.k8s_client import K8sClient
 from ..analyzers.storage_analyzer import StorageAnalyzer
+from ..models.storage_models import PVCWithPods
 from ..models.dashboard_models import (
     ClusterOverview,
     NamespaceSummary,
@@ -34,76 +40,205 @@ from ..models.dashboard_models import (
 # throttling is observed in specific environments.
 DEFAULT_NAMESPACE_BATCH_SIZE = 20
 
+# Unused PVC age histogram: inclusive upper edges (days) of all but the last
+# bucket; bisect_left maps an age to its bucket index
+AGE_BUCKET_EDGES = (7, 30, 90, 180)
+AGE_BUCKET_LABELS = ("0-7d", "8-30d", "31-90d", "91-180d", "180d+")
+
+
+# Static graph metadata, built once at import
+_GRAPH_CONFIGS: Tuple[GraphConfig, ...] = (
+    GraphConfig(
+        id="storage_usage",
+        name="Storage Usage",
+        description="Used vs unused capacity per namespace",
+        chart_type="bar",
+        default_enabled=True
+    ),
+    GraphConfig(
+        id="top_unused",
+        name="Top Unused PVCs",
+        description="Namespaces with most unused PVCs",
+        chart_type="bar",
+        default_enabled=True
+    ),
+    GraphConfig(
+        id="storage_class_dist",
+        name="Storage Class Distribution",
+        description="PVC distribution by storage class",
+        chart_type="doughnut",
+        default_enabled=False
+    ),
+    GraphConfig(
+        id="age_distribution",
+        name="Unused PVC Age Distribution",
+        description="Histogram of unused PVC ages",
+        chart_type="bar",
+        default_enabled=False
+    ),
+    GraphConfig(
+        id="unused_capacity",
+        name="Unused Capacity by Namespace",
+        description="Namespaces sorted by wasted capacity",
+        chart_type="bar",
+        default_enabled=False
+    ),
+    GraphConfig(
+        id="pvc_count",
+        name="PVC Count by Namespace",
+        description="Total PVC count per namespace",
+        chart_type="bar",
+        default_enabled=False
+    )
+)
+
+
+class _NsAgg(NamedTuple):
+    """Per-namespace totals kept between analysis and NamespaceSummary."""
+    
+    total_pvcs: int
+    unused_pvcs: int
+    bound_pvcs: int
+    pending_pvcs: int
+    total_capacity_gi: float
+    unused_capacity_gi: float
+    has_quota: bool
+
+
+def _top_by(
+    summaries: List[NamespaceSummary],
+    key: Callable[[NamespaceSummary], float],
+    limit: Optional[int] = None
+) -> List[NamespaceSummary]:
+    """Sort summaries by key, descending, keeping the top `limit`.
+    
+    With a limit this is heapq.nlargest (O(N log limit)), which returns the
+    same order, ties included, as sorted(..., reverse=True)[:limit].
+    
+    Args:
+        summaries: Namespace summaries
+        key: Sort key
+        limit: Optional number of summaries to keep
+        
+    Returns:
+        Summaries in descending key order
+    """
+    if limit:
+        return heapq.nlargest(limit, summaries, key=key)
+    return sorted(summaries, key=key, reverse=True)
+
 
 class DashboardAggregator:
     """Aggregate storage metrics across multiple namespaces."""
     
-    def __init__(self, storage_analyzer: StorageAnalyzer):
+    def __init__(self, storage_analyzer: StorageAnalyzer, label_selector: Optional[str] = None):
         """Initialize dashboard aggregator.
         
         Args:
             storage_analyzer: Storage analyzer instance for namespace analysis
+            label_selector: Optional namespace label selector; lets the API
+                server filter namespaces instead of listing all of them
         """
         self.analyzer = storage_analyzer
+        self.label_selector = label_selector
         self.namespace_service = storage_analyzer.namespace_service
         self.pvc_service = storage_analyzer.pvc_service
         self.quota_service = storage_analyzer.quota_service
+        # Dedicated pool for blocking analyzer calls: caps K8s API
+        # parallelism at one batch instead of the loop's default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=DEFAULT_NAMESPACE_BATCH_SIZE,
+            thread_name_prefix="dash-agg"
+        )
+        # Graphs rendered from namespace summaries: generate(summaries, limit).
+        # age_distribution is handled separately (async, reads PVC ages)
+        self._summary_graphs = {
+            "storage_usage": self._generate_storage_usage_graph,
+            "top_unused": self._generate_top_unused_graph,
+            "storage_class_dist": self._generate_storage_class_graph,
+            "unused_capacity": self._generate_unused_capacity_graph,
+            "pvc_count": self._generate_pvc_count_graph,
+        }
+    
+    def close(self):
+        """Shut down the aggregator's worker threads."""
+        self._executor.shutdown(wait=False)
     
     @classmethod
-    def from_k8s_client(cls, k8s_client: K8sClient) -> "DashboardAggregator":
+    def from_k8s_client(
+        cls,
+        k8s_client: K8sClient,
+        label_selector: Optional[str] = None
+    ) -> "DashboardAggregator":
         """Create aggregator from K8s client.
         
         Args:
             k8s_client: Kubernetes API client
+            label_selector: Optional namespace label selector
             
         Returns:
             Configured DashboardAggregator instance
         """
         analyzer = StorageAnalyzer.from_k8s_client(k8s_client)
-        return cls(analyzer)
+        return cls(analyzer, label_selector=label_selector)
     
     def get_cluster_overview(self) -> ClusterOverview:
-        """Get high-level cluster-wide statistics.
+        """Get high-level cluster-wide statistics (sync wrapper).
+        
+        Must not be called from a running event loop; use
+        get_cluster_overview_async there.
         
         Returns:
             Cluster overview with aggregate metrics
         """
-        namespaces = self.namespace_service.list_runai_namespaces()
+        return asyncio.run(self.get_cluster_overview_async())
+    
+    async def get_cluster_overview_async(self) -> ClusterOverview:
+        """Get high-level cluster-wide statistics (async batched fetch).
         
-        total_pvcs = 0
-        total_capacity_gi = 0.0
-        unused_capacity_gi = 0.0
-        total_unused_pvcs = 0
-        namespaces_with_quota = 0
+        Namespaces are analyzed concurrently in batches of
+        DEFAULT_NAMESPACE_BATCH_SIZE via get_namespace_summaries_async.
         
-        for namespace in namespaces:
-            try:
-                analysis = self.analyzer.analyze_namespace(namespace)
-                total_pvcs += analysis.summary.total_pvcs
-                total_capacity_gi += analysis.summary.total_capacity_gi
-                unused_capacity_gi += analysis.summary.unused_capacity_gi
-                total_unused_pvcs += analysis.summary.unused_pvcs
-                if analysis.summary.has_quota:
-                    namespaces_with_quota += 1
-            except Exception:
-                # Skip failed namespaces for overview
-                continue
-        
-        return ClusterOverview(
-            total_namespaces=len(namespaces),
-            total_pvcs=total_pvcs,
-            total_capacity_gi=total_capacity_gi,
-            unused_capacity_gi=unused_capacity_gi,
-            total_unused_pvcs=total_unused_pvcs,
-            namespaces_with_quota=namespaces_with_quota,
-            timestamp=datetime.now()
+        Returns:
+            Cluster overview with aggregate metrics
+        """
+        overview, _ = await self.get_dashboard_snapshot_async()
+        return overview
+    
+    def _aggregate_namespace(self, namespace: str, quotas: Optional[List[dict]] = None) -> _NsAgg:
+        """Analyze a namespace and keep only its dashboard totals.
+        
+        Runs in an executor thread; the full StorageAnalysis (PVC and pod
+        models) is released there instead of being handed back to the loop.
+        
+        Args:
+            namespace: Namespace to analyze
+            quotas: Pre-fetched resource quota dicts (listed if None)
+            
+        Returns:
+            Namespace totals
+        """
+        summary = self.analyzer.analyze_namespace(namespace, quotas).summary
+        return _NsAgg(
+            total_pvcs=summary.total_pvcs,
+            unused_pvcs=summary.unused_pvcs,
+            bound_pvcs=summary.bound_pvcs,
+            pending_pvcs=summary.pending_pvcs,
+            total_capacity_gi=summary.total_capacity_gi,
+            unused_capacity_gi=summary.unused_capacity_gi,
+            has_quota=summary.has_quota
         )
     
-    async def _fetch_summary(self, namespace: str) -> NamespaceSummary:
+    async def _fetch_summary(
+        self,
+        namespace: str,
+        quotas: Optional[List[dict]] = None
+    ) -> NamespaceSummary:
         """Fetch summary for a single namespace (async).
         
         Args:
             namespace: Namespace to analyze
+            quotas: Pre-fetched resource quota dicts (listed if None)
             
         Returns:
             Namespace summary with metrics
@@ -111,28 +246,62 @@ class DashboardAggregator:
         try:
             # Run sync analyzer in executor to avoid blocking
             loop = asyncio.get_event_loop()
-            analysis = await loop.run_in_executor(
-                None,
-                self.analyzer.analyze_namespace,
-                namespace
+            agg = await loop.run_in_executor(
+                self._executor,
+                self._aggregate_namespace,
+                namespace,
+                quotas
             )
             
-            return NamespaceSummary(
-                namespace=namespace,
-                total_pvcs=analysis.summary.total_pvcs,
-                unused_pvcs=analysis.summary.unused_pvcs,
-                bound_pvcs=analysis.summary.bound_pvcs,
-                pending_pvcs=analysis.summary.pending_pvcs,
-                total_capacity_gi=analysis.summary.total_capacity_gi,
-                unused_capacity_gi=analysis.summary.unused_capacity_gi,
-                has_quota=analysis.summary.has_quota
-            )
+            # Values come straight from a validated StorageSummary
+            return NamespaceSummary.model_construct(namespace=namespace, **agg._asdict())
         except Exception as e:
             return NamespaceSummary(
                 namespace=namespace,
                 error=str(e)
             )
     
+    async def list_namespaces_async(self) -> List[str]:
+        """List the Run.ai namespaces on the worker pool (async).
+        
+        The namespace list may need a K8s API round trip, which must not run
+        on the event loop.
+        
+        Returns:
+            List of Run.ai namespace names
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            self.namespace_service.list_runai_namespaces,
+            self.label_selector
+        )
+    
+    async def _fetch_quotas_by_namespace(self, namespaces: List[str]) -> Dict[str, List[dict]]:
+        """List the resource quotas of all namespaces in one call (async).
+        
+        Replaces one quota list call per namespace. On failure an empty
+        mapping is returned and each namespace lists its own quotas.
+        
+        Args:
+            namespaces: Namespaces to fetch quotas for
+            
+        Returns:
+            Mapping of namespace to resource quota dictionaries
+        """
+        if not namespaces:
+            return {}
+        
+        loop = asyncio.get_event_loop()
+        try:
+            return await loop.run_in_executor(
+                self._executor,
+                self.pvc_service.k8s.list_resource_quotas_by_namespace,
+                namespaces
+            )
+        except Exception:
+            return {}
+    
     async def get_namespace_summaries_async(
         self,
         namespaces: Optional[List[str]] = None,
@@ -148,13 +317,15 @@ class DashboardAggregator:
             List of namespace summaries (includes errors as error markers)
         """
         if namespaces is None:
-            namespaces = self.namespace_service.list_runai_namespaces()
+            namespaces = await self.list_namespaces_async()
+        
+        quotas_by_namespace = await self._fetch_quotas_by_namespace(namespaces)
         
         # Fetch in batches to avoid overwhelming K8s API
         summaries = []
         for i in range(0, len(namespaces), batch_size):
             batch = namespaces[i:i + batch_size]
-            tasks = [self._fetch_summary(ns) for ns in batch]
+            tasks = [self._fetch_summary(ns, quotas_by_namespace.get(ns)) for ns in batch]
             
             # Use wait_for with timeout
             try:
@@ -181,6 +352,37 @@ class DashboardAggregator:
         
         return summaries
     
+    async def get_dashboard_snapshot_async(
+        self,
+        namespaces: Optional[List[str]] = None
+    ) -> Tuple[ClusterOverview, List[NamespaceSummary]]:
+        """Get cluster overview and namespace summaries from one fetch.
+        
+        The overview is derived from the summaries, so every namespace is
+        analyzed once instead of once per call.
+        
+        Args:
+            namespaces: Optional list to filter. If None, fetches all Run.ai namespaces.
+            
+        Returns:
+            Tuple of (cluster overview, namespace summaries)
+        """
+        summaries = await self.get_namespace_summaries_async(namespaces)
+        
+        # Failed namespaces are skipped in the overview totals
+        valid = [s for s in summaries if s.error is None]
+        overview = ClusterOverview(
+            total_namespaces=len(summaries),
+            total_pvcs=sum(s.total_pvcs for s in valid),
+            total_capacity_gi=sum(s.total_capacity_gi for s in valid),
+            unused_capacity_gi=sum(s.unused_capacity_gi for s in valid),
+            total_unused_pvcs=sum(s.unused_pvcs for s in valid),
+            namespaces_with_quota=sum(1 for s in valid if s.has_quota),
+            timestamp=datetime.now()
+        )
+        
+        return overview, summaries
+    
     async def stream_namespace_summaries(
         self,
         namespaces: List[str]
@@ -205,56 +407,31 @@ class DashboardAggregator:
                     error=str(e)
                 )
     
+    async def stream_namespace_summaries_jsonl(
+        self,
+        namespaces: Optional[List[str]] = None
+    ) -> AsyncGenerator[str, None]:
+        """Stream namespace summaries as JSON lines, in completion order.
+        
+        Args:
+            namespaces: Optional list to filter. If None, streams all Run.ai namespaces.
+            
+        Yields:
+            One JSON-encoded NamespaceSummary per line (newline-terminated)
+        """
+        if namespaces is None:
+            namespaces = await self.list_namespaces_async()
+        
+        async for summary in self.stream_namespace_summaries(namespaces):
+            yield summary.to_json() + "\n"
+    
     def get_available_graph_configs(self) -> List[GraphConfig]:
         """Get list of available graph types with metadata.
         
         Returns:
             List of graph configurations
         """
-        return [
-            GraphConfig(
-                id="storage_usage",
-                name="Storage Usage",
-                description="Used vs unused capacity per namespace",
-                chart_type="bar",
-                default_enabled=True
-            ),
-            GraphConfig(
-                id="top_unused",
-                name="Top Unused PVCs",
-                description="Namespaces with most unused PVCs",
-                chart_type="bar",
-                default_enabled=True
-            ),
-            GraphConfig(
-                id="storage_class_dist",
-                name="Storage Class Distribution",
-                description="PVC distribution by storage class",
-                chart_type="doughnut",
-                default_enabled=False
-            ),
-            GraphConfig(
-                id="age_distribution",
-                name="Unused PVC Age Distribution",
-                description="Histogram of unused PVC ages",
-                chart_type="bar",
-                default_enabled=False
-            ),
-            GraphConfig(
-                id="unused_capacity",
-                name="Unused Capacity by Namespace",
-                description="Namespaces sorted by wasted capacity",
-                chart_type="bar",
-                default_enabled=False
-            ),
-            GraphConfig(
-                id="pvc_count",
-                name="PVC Count by Namespace",
-                description="Total PVC count per namespace",
-                chart_type="bar",
-                default_enabled=False
-            )
-        ]
+        return list(_GRAPH_CONFIGS)
     
     async def get_graph_data_async(
         self,
@@ -272,25 +449,20 @@ class DashboardAggregator:
         Returns:
             Graph data formatted for Chart.js
         """
+        if graph_type == "age_distribution":
+            # Needs only unused PVC ages, not full namespace summaries
+            return await self._generate_age_distribution_graph(namespaces)
+        
+        generate = self._summary_graphs.get(graph_type)
+        if generate is None:
+            raise ValueError(f"Unknown graph type: {graph_type}")
+        
         summaries = await self.get_namespace_summaries_async(namespaces)
         
         # Filter out error summaries
         valid_summaries = [s for s in summaries if s.error is None]
         
-        if graph_type == "storage_usage":
-            return self._generate_storage_usage_graph(valid_summaries, limit)
-        elif graph_type == "top_unused":
-            return self._generate_top_unused_graph(valid_summaries, limit)
-        elif graph_type == "storage_class_dist":
-            return self._generate_storage_class_graph(valid_summaries)
-        elif graph_type == "age_distribution":
-            return await self._generate_age_distribution_graph(namespaces)
-        elif graph_type == "unused_capacity":
-            return self._generate_unused_capacity_graph(valid_summaries, limit)
-        elif graph_type == "pvc_count":
-            return self._generate_pvc_count_graph(valid_summaries, limit)
-        else:
-            raise ValueError(f"Unknown graph type: {graph_type}")
+        return generate(valid_summaries, limit)
     
     def _generate_storage_usage_graph(
         self,
@@ -299,15 +471,15 @@ class DashboardAggregator:
     ) -> GraphData:
         """Generate storage usage bar chart."""
         if limit:
-            summaries = sorted(
-                summaries,
-                key=lambda s: s.total_capacity_gi,
-                reverse=True
-            )[:limit]
+            summaries = _top_by(summaries, lambda s: s.total_capacity_gi, limit)
         
-        labels = [s.namespace for s in summaries]
-        used_data = [s.total_capacity_gi - s.unused_capacity_gi for s in summaries]
-        unused_data = [s.unused_capacity_gi for s in summaries]
+        # Single pass over the summaries for all three series
+        labels, used_data, unused_data = [], [], []
+        for s in summaries:
+            unused_gi = s.unused_capacity_gi
+            labels.append(s.namespace)
+            used_data.append(s.total_capacity_gi - unused_gi)
+            unused_data.append(unused_gi)
         
         return GraphData(
             type="bar",
@@ -338,14 +510,7 @@ class DashboardAggregator:
         limit: Optional[int] = None
     ) -> GraphData:
         """Generate top unused PVCs bar chart."""
-        sorted_summaries = sorted(
-            summaries,
-            key=lambda s: s.unused_pvcs,
-            reverse=True
-        )
-        
-        if limit:
-            sorted_summaries = sorted_summaries[:limit]
+        sorted_summaries = _top_by(summaries, lambda s: s.unused_pvcs, limit)
         
         labels = [s.namespace for s in sorted_summaries]
         data = [s.unused_pvcs for s in sorted_summaries]
@@ -367,7 +532,8 @@ class DashboardAggregator:
     
     def _generate_storage_class_graph(
         self,
-        summaries: List[NamespaceSummary]
+        summaries: List[NamespaceSummary],
+        limit: Optional[int] = None
     ) -> GraphData:
         """Generate storage class distribution pie chart."""
         # This would require fetching storage class data
@@ -387,14 +553,7 @@ class DashboardAggregator:
         limit: Optional[int] = None
     ) -> GraphData:
         """Generate unused capacity bar chart."""
-        sorted_summaries = sorted(
-            summaries,
-            key=lambda s: s.unused_capacity_gi,
-            reverse=True
-        )
-        
-        if limit:
-            sorted_summaries = sorted_summaries[:limit]
+        sorted_summaries = _top_by(summaries, lambda s: s.unused_capacity_gi, limit)
         
         labels = [s.namespace for s in sorted_summaries]
         data = [s.unused_capacity_gi for s in sorted_summaries]
@@ -420,14 +579,7 @@ class DashboardAggregator:
         limit: Optional[int] = None
     ) -> GraphData:
         """Generate PVC count bar chart."""
-        sorted_summaries = sorted(
-            summaries,
-            key=lambda s: s.total_pvcs,
-            reverse=True
-        )
-        
-        if limit:
-            sorted_summaries = sorted_summaries[:limit]
+        sorted_summaries = _top_by(summaries, lambda s: s.total_pvcs, limit)
         
         labels = [s.namespace for s in sorted_summaries]
         data = [s.total_pvcs for s in sorted_summaries]
@@ -447,40 +599,52 @@ class DashboardAggregator:
             }
         )
     
+    async def _fetch_unused(self, namespace: str) -> List[PVCWithPods]:
+        """Fetch unused PVCs for a namespace (async).
+        
+        Args:
+            namespace: Namespace to scan
+            
+        Returns:
+            Unused PVCs with pods
+        """
+        loop = asyncio.get_event_loop()
+        unused = await loop.run_in_executor(self._executor, self.analyzer.get_unused_pvcs, namespace)
+        return unused.pvcs
+    
     async def _generate_age_distribution_graph(
         self,
         namespaces: Optional[List[str]] = None
     ) -> GraphData:
         """Generate age distribution histogram for unused PVCs."""
         if namespaces is None:
-            namespaces = self.namespace_service.list_runai_namespaces()
+            namespaces = await self.list_namespaces_async()
         
-        age_buckets = {"0-7d": 0, "8-30d": 0, "31-90d": 0, "91-180d": 0, "180d+": 0}
+        ages: List[int] = []
         
-        for namespace in namespaces:
-            try:
-                unused_pvcs = self.analyzer.get_unused_pvcs(namespace)
-                for pvc_wp in unused_pvcs:
-                    age_days = pvc_wp.pvc.age_days or 0
-                    if age_days <= 7:
-                        age_buckets["0-7d"] += 1
-                    elif age_days <= 30:
-                        age_buckets["8-30d"] += 1
-                    elif age_days <= 90:
-                        age_buckets["31-90d"] += 1
-                    elif age_days <= 180:
-                        age_buckets["91-180d"] += 1
-                    else:
-                        age_buckets["180d+"] += 1
-            except Exception:
-                continue
+        # Fetch in batches, like get_namespace_summaries_async; namespaces
+        # that fail are skipped
+        batch_size = DEFAULT_NAMESPACE_BATCH_SIZE
+        for i in range(0, len(namespaces), batch_size):
+            batch = namespaces[i:i + batch_size]
+            results = await asyncio.gather(
+                *(self._fetch_unused(ns) for ns in batch),
+                return_exceptions=True
+            )
+            for unused_pvcs in results:
+                if isinstance(unused_pvcs, Exception):
+                    continue
+                ages.extend(pvc_wp.pvc.age_days or 0 for pvc_wp in unused_pvcs)
+        
+        # Bucket all ages in one pass instead of an if/elif ladder per PVC
+        bucket_counts = Counter(map(partial(bisect.bisect_left, AGE_BUCKET_EDGES), ages))
         
         return GraphData(
             type="bar",
-            labels=list(age_buckets.keys()),
+            labels=list(AGE_BUCKET_LABELS),
             datasets=[{
                 "label": "Unused PVCs",
-                "data": list(age_buckets.values()),
+                "data": [bucket_counts[i] for i in range(len(AGE_BUCKET_LABELS))],
                 "backgroundColor": "#ef4444"
             }],
             options={
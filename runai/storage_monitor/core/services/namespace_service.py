@@ -15,10 +15,29 @@
 
 """Namespace operations service."""
 
-from typing import List
+import threading
+import time
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple, Union
 from ..clients.k8s_client import K8sClient
 
 
+# Seconds a namespace list is reused; covers the repeated lookups of a
+# single dashboard render or CLI command
+NAMESPACE_CACHE_TTL = 5.0
+
+RUNAI_NAMESPACE_PREFIX = "runai-"
+
+
+class _NamespaceCacheEntry(NamedTuple):
+    """One cached namespace list plus views derived from it."""
+    
+    fetched_at: float
+    namespaces: List[dict]
+    names: FrozenSet[str]
+    # prefix -> sorted matching names, filled on first use
+    sorted_by_prefix: Dict[Union[str, Tuple[str, ...]], List[str]]
+
+
 class NamespaceService:
     """Service for namespace-related operations."""
     
@@ -29,21 +48,62 @@ class NamespaceService:
             k8s_client: Kubernetes API client
         """
         self.k8s = k8s_client
+        self._ns_cache: Dict[Optional[str], _NamespaceCacheEntry] = {}
+        self._ns_cache_lock = threading.Lock()
+    
+    def _get_namespaces_cached(self, label_selector: Optional[str] = None) -> _NamespaceCacheEntry:
+        """List namespaces, reusing a result younger than NAMESPACE_CACHE_TTL.
+        
+        Args:
+            label_selector: Optional label selector applied server-side
+            
+        Returns:
+            Cache entry with the namespace dicts and derived views
+        """
+        now = time.monotonic()
+        with self._ns_cache_lock:
+            cached = self._ns_cache.get(label_selector)
+        if cached is not None and now - cached.fetched_at < NAMESPACE_CACHE_TTL:
+            return cached
+        
+        namespaces = self.k8s.list_namespaces(label_selector)
+        entry = _NamespaceCacheEntry(
+            fetched_at=now,
+            namespaces=namespaces,
+            names=frozenset(ns["name"] for ns in namespaces),
+            sorted_by_prefix={}
+        )
+        with self._ns_cache_lock:
+            self._ns_cache[label_selector] = entry
+        return entry
     
-    def list_runai_namespaces(self) -> List[str]:
+    def list_runai_namespaces(
+        self,
+        label_selector: Optional[str] = None,
+        prefix: Union[str, Tuple[str, ...]] = RUNAI_NAMESPACE_PREFIX
+    ) -> List[str]:
         """List all Run.ai namespaces (prefixed with 'runai-').
         
+        The filtered, sorted list is computed once per cached namespace list
+        and per prefix.
+        
+        Args:
+            label_selector: Optional label selector applied server-side
+                before the prefix filter
+            prefix: Name prefix, or tuple of prefixes, to match
+            
         Returns:
             List of Run.ai namespace names
         """
-        all_namespaces = self.k8s.list_namespaces()
+        entry = self._get_namespaces_cached(label_selector)
         
-        runai_namespaces = [
-            ns["name"] for ns in all_namespaces
-            if ns["name"].startswith("runai-")
-        ]
+        matching = entry.sorted_by_prefix.get(prefix)
+        if matching is None:
+            matching = sorted(name for name in entry.names if name.startswith(prefix))
+            entry.sorted_by_prefix[prefix] = matching
         
-        return sorted(runai_namespaces)
+        # Copy so callers cannot modify the cached list
+        return list(matching)
     
     def list_all_namespaces(self) -> List[str]:
         """List all namespaces in the cluster.
@@ -51,8 +111,7 @@ class NamespaceService:
         Returns:
             List of all namespace names
         """
-        all_namespaces = self.k8s.list_namespaces()
-        return sorted([ns["name"] for ns in all_namespaces])
+        return sorted(self._get_namespaces_cached().names)
     
     def namespace_exists(self, namespace: str) -> bool:
         """Check if a namespace exists.
@@ -63,6 +122,5 @@ class NamespaceService:
         Returns:
             True if namespace exists, False otherwise
         """
-        all_namespaces = self.k8s.list_namespaces()
-        return any(ns["name"] == namespace for ns in all_namespaces)
+        return namespace in self._get_namespaces_cached().names
 
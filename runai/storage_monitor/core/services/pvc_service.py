@@ -15,12 +15,49 @@
 
 """PVC operations service using K8s API."""
 
-from typing import List, Dict
+from collections import defaultdict
+from functools import lru_cache
+from typing import Iterable, List, Dict, Optional
 from datetime import datetime, timezone
 from ..clients.k8s_client import K8sClient
+from ..clients.namespace_snapshot import NamespaceSnapshot
 from ..models.storage_models import PVC, Pod, PVCWithPods
 
 
+# Binary unit suffix -> GiB multiplier
+_UNIT_MULT = {
+    "Ti": 1024.0,
+    "Gi": 1.0,
+    "Mi": 1.0 / 1024.0,
+    "Ki": 1.0 / (1024.0 * 1024.0),
+}
+
+
+# Capacity strings have very low cardinality ("10Gi", "100Gi", "1Ti"), so one
+# process-wide memo serves every service instance
+@lru_cache(maxsize=1024)
+def _parse_capacity_to_gi(capacity: str) -> float:
+    """Parse capacity string to GiB float.
+    
+    Args:
+        capacity: Capacity string like "100Gi", "1Ti", "500Mi"
+        
+    Returns:
+        Capacity in GiB as float
+    """
+    if not capacity or capacity == "Unknown":
+        return 0.0
+    
+    capacity = capacity.strip()
+    
+    mult = _UNIT_MULT.get(capacity[-2:])
+    if mult is not None:
+        return float(capacity[:-2]) * mult
+    
+    # Assume bytes
+    return float(capacity) / (1024 ** 3)
+
+
 class PVCService:
     """Service for PVC-related operations."""
     
@@ -32,16 +69,26 @@ class PVCService:
         """
         self.k8s = k8s_client
     
-    def list_pvcs(self, namespace: str) -> List[PVC]:
+    def list_pvcs(self, namespace: str, snapshot: Optional[NamespaceSnapshot] = None) -> List[PVC]:
         """Get all PVCs in a namespace.
         
+        Models are built with model_construct (no validation); the input
+        dicts come from K8sClient and already have the model's types.
+        
         Args:
             namespace: Kubernetes namespace
+            snapshot: Optional request-scoped list memo (lists from K8s if None)
             
         Returns:
             List of PVC models
         """
-        pvc_dicts = self.k8s.list_pvcs(namespace)
+        if snapshot is not None:
+            pvc_dicts = snapshot.pvcs
+        else:
+            pvc_dicts = self.k8s.list_pvcs(namespace)
+        
+        # One clock read per list, so ages share a single reference time
+        now = datetime.now(timezone.utc)
         
         pvcs = []
         for pvc_dict in pvc_dicts:
@@ -51,9 +98,10 @@ class PVCService:
                 created = pvc_dict["creation_timestamp"]
                 if created.tzinfo is None:
                     created = created.replace(tzinfo=timezone.utc)
-                age_days = (datetime.now(timezone.utc) - created).days
+                age_days = (now - created).days
             
-            pvcs.append(PVC(
+            # Trusted, already-typed dicts from K8sClient: skip validation
+            pvcs.append(PVC.model_construct(
                 name=pvc_dict["name"],
                 namespace=pvc_dict["namespace"],
                 status=pvc_dict["status"],
@@ -64,27 +112,36 @@ class PVCService:
                 creation_timestamp=pvc_dict["creation_timestamp"],
                 age_days=age_days,
                 labels=pvc_dict["labels"],
-                annotations=pvc_dict["annotations"]
+                annotations=pvc_dict.get("annotations") or {}
             ))
         
         return pvcs
     
-    def get_pvc_pods(self, namespace: str, pvc_name: str) -> List[Pod]:
+    def get_pvc_pods(
+        self,
+        namespace: str,
+        pvc_name: str,
+        snapshot: Optional[NamespaceSnapshot] = None
+    ) -> List[Pod]:
         """Find all pods using a specific PVC.
         
         Args:
             namespace: Kubernetes namespace
             pvc_name: PVC name to search for
+            snapshot: Optional request-scoped list memo (lists from K8s if None)
             
         Returns:
             List of pods using the PVC
         """
-        pod_dicts = self.k8s.list_pods(namespace)
+        if snapshot is not None:
+            pod_dicts = snapshot.pods
+        else:
+            pod_dicts = self.k8s.list_pods(namespace)
         
         using_pods = []
         for pod_dict in pod_dicts:
             if pvc_name in pod_dict.get("pvc_claims", []):
-                using_pods.append(Pod(
+                using_pods.append(Pod.model_construct(
                     name=pod_dict["name"],
                     namespace=pod_dict["namespace"],
                     status=pod_dict["status"],
@@ -96,70 +153,85 @@ class PVCService:
         
         return using_pods
     
-    def get_pvcs_with_pods(self, namespace: str) -> List[PVCWithPods]:
+    def get_pvcs_with_pods(
+        self,
+        namespace: str,
+        snapshot: Optional[NamespaceSnapshot] = None
+    ) -> List[PVCWithPods]:
         """Get all PVCs enriched with pod usage information.
         
         Args:
             namespace: Kubernetes namespace
+            snapshot: Optional request-scoped list memo (lists from K8s if None)
             
         Returns:
             List of PVCs with their associated pods
         """
-        pvcs = self.list_pvcs(namespace)
-        pod_dicts = self.k8s.list_pods(namespace)
+        pvcs = self.list_pvcs(namespace, snapshot)
+        if snapshot is not None:
+            pod_dicts = snapshot.pods
+        else:
+            pod_dicts = self.k8s.list_pods(namespace)
         
-        # Build PVC -> Pods mapping
-        pvc_to_pods: Dict[str, List[Pod]] = {}
-        for pod_dict in pod_dicts:
-            for pvc_name in pod_dict.get("pvc_claims", []):
-                if pvc_name not in pvc_to_pods:
-                    pvc_to_pods[pvc_name] = []
-                
-                pvc_to_pods[pvc_name].append(Pod(
-                    name=pod_dict["name"],
-                    namespace=pod_dict["namespace"],
-                    status=pod_dict["status"],
-                    node_name=pod_dict["node_name"],
-                    pvc_claims=pod_dict["pvc_claims"],
-                    creation_timestamp=pod_dict["creation_timestamp"],
-                    labels=pod_dict["labels"]
-                ))
+        pvc_to_pods = self._index_pods_by_pvc(pod_dicts)
         
-        # Create PVCWithPods objects
+        # Create PVCWithPods objects (one dict lookup per PVC)
         result = []
         for pvc in pvcs:
             pods = pvc_to_pods.get(pvc.name, [])
-            result.append(PVCWithPods(
+            result.append(PVCWithPods.model_construct(
                 pvc=pvc,
                 pods=pods,
-                is_unused=(len(pods) == 0)
+                is_unused=not pods
             ))
         
         return result
     
-    def parse_capacity_to_gi(self, capacity: str) -> float:
-        """Parse capacity string to GiB float.
+    @staticmethod
+    def _index_pods_by_pvc(pod_dicts: List[dict]) -> Dict[str, List[Pod]]:
+        """Index pods by the PVC claims they mount.
+        
+        Iterates the pods once, so correlating PVCs with pods is
+        O(pods + PVCs) rather than a scan of all pods per PVC.
         
         Args:
-            capacity: Capacity string like "100Gi", "1Ti", "500Mi"
+            pod_dicts: Pod dictionaries from the K8s client
             
         Returns:
-            Capacity in GiB as float
+            Mapping of PVC name to the pods mounting it
         """
-        if not capacity or capacity == "Unknown":
-            return 0.0
-        
-        capacity = capacity.strip()
-        
-        if capacity.endswith("Ti"):
-            return float(capacity[:-2]) * 1024
-        elif capacity.endswith("Gi"):
-            return float(capacity[:-2])
-        elif capacity.endswith("Mi"):
-            return float(capacity[:-2]) / 1024
-        elif capacity.endswith("Ki"):
-            return float(capacity[:-2]) / (1024 * 1024)
-        else:
-            # Assume bytes
-            return float(capacity) / (1024 ** 3)
-
+        pvc_to_pods: Dict[str, List[Pod]] = defaultdict(list)
+        for pod_dict in pod_dicts:
+            pvc_claims = pod_dict.get("pvc_claims")
+            if not pvc_claims:
+                continue
+            
+            # One Pod per pod, shared by every PVC it mounts
+            pod = Pod.model_construct(
+                name=pod_dict["name"],
+                namespace=pod_dict["namespace"],
+                status=pod_dict["status"],
+                node_name=pod_dict["node_name"],
+                pvc_claims=pvc_claims,
+                creation_timestamp=pod_dict["creation_timestamp"],
+                labels=pod_dict["labels"]
+            )
+            for pvc_name in pvc_claims:
+                pvc_to_pods[pvc_name].append(pod)
+        
+        return pvc_to_pods
+    
+    # Memoized module-level parser (see _parse_capacity_to_gi)
+    parse_capacity_to_gi = staticmethod(_parse_capacity_to_gi)
+    
+    def parse_capacities_to_gi(self, capacities: Iterable[str]) -> List[float]:
+        """Parse a batch of capacity strings to GiB floats.
+        
+        Args:
+            capacities: Capacity strings like "100Gi", "1Ti", "500Mi"
+            
+        Returns:
+            Capacities in GiB, in input order
+        """
+        parse = self.parse_capacity_to_gi
+        return [parse(capacity) for capacity in capacities]
@@ -15,11 +15,20 @@
 
 """Resource quota operations service."""
 
-from typing import Optional
+import threading
+from typing import Dict, List, Optional, Tuple
 from ..clients.k8s_client import K8sClient
+from ..clients.namespace_snapshot import NamespaceSnapshot
 from ..models.storage_models import ResourceQuota
 
 
+# Quota keys that bound storage; only these are read for storage quotas
+STORAGE_KEYS = ("requests.storage", "persistentvolumeclaims")
+
+# Built storage quotas remembered per (namespace, quota resourceVersions)
+STORAGE_QUOTA_MEMO_MAXSIZE = 256
+
+
 class QuotaService:
     """Service for resource quota operations."""
     
@@ -30,18 +39,57 @@ class QuotaService:
             k8s_client: Kubernetes API client
         """
         self.k8s = k8s_client
+        self._storage_quota_memo: Dict[Tuple, Optional[ResourceQuota]] = {}
+        self._memo_lock = threading.Lock()
     
-    def get_storage_quota(self, namespace: str) -> Optional[ResourceQuota]:
+    def _list_quota_dicts(self, namespace: str, snapshot: Optional[NamespaceSnapshot]) -> List[dict]:
+        """Get a namespace's resource quota dicts from the snapshot or K8s."""
+        if snapshot is not None:
+            return snapshot.quotas
+        return self.k8s.list_resource_quotas(namespace)
+    
+    def get_storage_quota(
+        self,
+        namespace: str,
+        snapshot: Optional[NamespaceSnapshot] = None
+    ) -> Optional[ResourceQuota]:
         """Get storage-related resource quotas for a namespace.
         
+        This is the storage view used by the analysis, summaries and the CLI
+        quota command: hard_limits and used hold only the STORAGE_KEYS
+        limits, and a namespace whose quotas bound only compute or GPUs has
+        no storage quota (None). get_full_quota reports every limit of the
+        same quotas.
+        
         Args:
             namespace: Kubernetes namespace
+            snapshot: Optional request-scoped list memo (lists from K8s if None)
             
         Returns:
-            ResourceQuota if quotas exist, None otherwise
+            ResourceQuota if a quota bounds storage, None otherwise
         """
-        quota_dicts = self.k8s.list_resource_quotas(namespace)
+        return self._build_storage_quota(namespace, self._list_quota_dicts(namespace, snapshot))
+    
+    def get_full_quota(
+        self,
+        namespace: str,
+        snapshot: Optional[NamespaceSnapshot] = None
+    ) -> Optional[ResourceQuota]:
+        """Get all resource quota limits of a namespace combined into one.
         
+        Backs the /namespaces/{namespace}/quotas endpoint, which reports
+        every limit, so hard_limits include compute and GPU keys that
+        get_storage_quota drops. A quota is returned even if none of its
+        limits bound storage (has_storage_quota is then False).
+        
+        Args:
+            namespace: Kubernetes namespace
+            snapshot: Optional request-scoped list memo (lists from K8s if None)
+            
+        Returns:
+            ResourceQuota if quotas exist, None otherwise
+        """
+        quota_dicts = self._list_quota_dicts(namespace, snapshot)
         if not quota_dicts:
             return None
         
@@ -53,31 +101,89 @@ class QuotaService:
             combined_hard.update(quota_dict.get("hard_limits", {}))
             combined_used.update(quota_dict.get("used", {}))
         
-        # Check for storage-related quotas
-        has_storage_quota = any(
-            key in combined_hard
-            for key in ["requests.storage", "persistentvolumeclaims"]
-        )
+        # Use first quota name if multiple
+        return self._make_quota(namespace, quota_dicts[0]["name"], combined_hard, combined_used)
+    
+    def _build_storage_quota(self, namespace: str, quota_dicts: List[dict]) -> Optional[ResourceQuota]:
+        """Combine the storage limits of a namespace's resource quota dicts.
         
-        if not has_storage_quota and not quota_dicts:
-            return None
+        The result is memoized by the quotas' names and resourceVersions, so
+        repeated calls for unchanged quotas return the previously built
+        object. Any quota change, addition or deletion changes the key.
         
-        # Use first quota name if multiple
-        quota_name = quota_dicts[0]["name"] if quota_dicts else "combined"
+        Args:
+            namespace: Kubernetes namespace
+            quota_dicts: Resource quota dictionaries of the namespace
+            
+        Returns:
+            ResourceQuota if a quota bounds storage, None otherwise
+        """
+        key = (namespace,) + tuple((q["name"], q.get("resource_version")) for q in quota_dicts)
+        if None in (rv for _, rv in key[1:]):
+            # Without resourceVersions a change cannot be detected
+            return self._combine_storage_limits(namespace, quota_dicts)
         
-        return ResourceQuota(
-            name=quota_name,
+        with self._memo_lock:
+            if key in self._storage_quota_memo:
+                # Re-insert to mark as most recently used
+                quota = self._storage_quota_memo[key] = self._storage_quota_memo.pop(key)
+                return quota
+        
+        quota = self._combine_storage_limits(namespace, quota_dicts)
+        with self._memo_lock:
+            if len(self._storage_quota_memo) >= STORAGE_QUOTA_MEMO_MAXSIZE:
+                # Evict the least recently used entry (dicts keep insertion order)
+                self._storage_quota_memo.pop(next(iter(self._storage_quota_memo)))
+            self._storage_quota_memo[key] = quota
+        return quota
+    
+    def _combine_storage_limits(self, namespace: str, quota_dicts: List[dict]) -> Optional[ResourceQuota]:
+        """Build a ResourceQuota from the STORAGE_KEYS limits of quota dicts."""
+        hard = {}
+        used = {}
+        quota_name = None
+        
+        # Single pass reading only the storage keys; later quotas win, as
+        # with a dict.update() merge
+        for quota_dict in quota_dicts:
+            quota_hard = quota_dict.get("hard_limits") or {}
+            quota_used = quota_dict.get("used") or {}
+            for key in STORAGE_KEYS:
+                if key in quota_hard:
+                    hard[key] = quota_hard[key]
+                    if quota_name is None:
+                        quota_name = quota_dict["name"]
+                if key in quota_used:
+                    used[key] = quota_used[key]
+        
+        if not hard:
+            return None
+        
+        return self._make_quota(namespace, quota_name, hard, used)
+    
+    def _make_quota(
+        self,
+        namespace: str,
+        name: str,
+        hard: Dict[str, str],
+        used: Dict[str, str]
+    ) -> ResourceQuota:
+        """Build a ResourceQuota from combined hard and used limits."""
+        # Fields come straight from the client's quota dicts; skip validation
+        return ResourceQuota.model_construct(
+            name=name,
             namespace=namespace,
-            hard_limits=combined_hard,
-            used=combined_used,
-            has_storage_quota=has_storage_quota,
-            storage_limit=combined_hard.get("requests.storage"),
-            storage_used=combined_used.get("requests.storage"),
-            pvc_count_limit=self._parse_int(combined_hard.get("persistentvolumeclaims")),
-            pvc_count_used=self._parse_int(combined_used.get("persistentvolumeclaims"))
+            hard_limits=hard,
+            used=used,
+            has_storage_quota=not hard.keys().isdisjoint(STORAGE_KEYS),
+            storage_limit=hard.get("requests.storage"),
+            storage_used=used.get("requests.storage"),
+            pvc_count_limit=self._parse_int(hard.get("persistentvolumeclaims")),
+            pvc_count_used=self._parse_int(used.get("persistentvolumeclaims"))
         )
     
-    def _parse_int(self, value: any) -> Optional[int]:
+    @staticmethod
+    def _parse_int(value: any) -> Optional[int]:
         """Parse integer from string or int value.
         
         Args:
@@ -89,6 +195,13 @@ class QuotaService:
         if value is None:
             return None
         
+        # Plain counts ("10") and ints skip the try/except path
+        value_type = type(value)
+        if value_type is int:
+            return value
+        if value_type is str and value.isascii() and value.isdigit():
+            return int(value)
+        
         try:
             return int(value)
         except (ValueError, TypeError):
@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Shared test fixtures: a K8sClient wired to a mocked CoreV1Api."""
+
+import json
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from kubernetes import client
+
+from runai_storage_monitor.core.clients.k8s_client import K8sClient
+
+
+@pytest.fixture
+def raw_list():
+    """Factory for raw list responses, as returned with _preload_content=False."""
+    def make(items):
+        return SimpleNamespace(data=json.dumps({"items": items}).encode())
+    return make
+
+
+@pytest.fixture
+def core_v1():
+    """Mocked CoreV1Api; tests set the return values of the list calls they use."""
+    return mock.create_autospec(client.CoreV1Api, instance=True)
+
+
+@pytest.fixture
+def storage_v1():
+    """Mocked StorageV1Api with no storage classes."""
+    storage_v1 = mock.create_autospec(client.StorageV1Api, instance=True)
+    storage_v1.list_storage_class.return_value = client.V1StorageClassList(items=[])
+    return storage_v1
+
+
+@pytest.fixture
+def k8s_client(core_v1, storage_v1):
+    """K8sClient using the mocked API clients instead of a kubeconfig."""
+    k8s = K8sClient()
+    k8s._core_v1 = core_v1
+    k8s._storage_v1 = storage_v1
+    k8s._initialized = True
+    return k8s
+
+
+def _raw_pvc(name, namespace, capacity):
+    return {
+        "metadata": {"name": name, "namespace": namespace, "creationTimestamp": "2024-01-01T00:00:00Z"},
+        "spec": {"storageClassName": "standard", "accessModes": ["ReadWriteOnce"], "volumeName": f"pv-{name}"},
+        "status": {"phase": "Bound", "capacity": {"storage": capacity}},
+    }
+
+
+def _raw_pod(name, namespace, claim_name):
+    return {
+        "metadata": {"name": name, "namespace": namespace, "creationTimestamp": "2024-01-02T00:00:00Z"},
+        "spec": {"nodeName": "node-1", "volumes": [{"name": "data", "persistentVolumeClaim": {"claimName": claim_name}}]},
+        "status": {"phase": "Running"},
+    }
+
+
+@pytest.fixture
+def fake_cluster(core_v1, raw_list):
+    """Configure core_v1 as a small cluster.
+    
+    runai-a has a 10Gi PVC mounted by a pod, an unused 20Gi PVC and a storage
+    quota; runai-b has one unused 1Ti PVC and no quota; "default" is not a
+    Run.ai namespace.
+    """
+    pvcs = {
+        "runai-a": [_raw_pvc("data-a", "runai-a", "10Gi"), _raw_pvc("scratch-a", "runai-a", "20Gi")],
+        "runai-b": [_raw_pvc("data-b", "runai-b", "1Ti")],
+    }
+    pods = {"runai-a": [_raw_pod("train-a", "runai-a", "data-a")]}
+    quota = {
+        "metadata": {"name": "storage-quota", "namespace": "runai-a", "resourceVersion": "7"},
+        "status": {"hard": {"requests.storage": "100Gi"}, "used": {"requests.storage": "30Gi"}},
+    }
+    
+    core_v1.list_namespace.return_value = client.V1NamespaceList(items=[
+        client.V1Namespace(metadata=client.V1ObjectMeta(name=name), status=client.V1NamespaceStatus(phase="Active"))
+        for name in ("default", "runai-b", "runai-a")
+    ])
+    core_v1.list_namespaced_persistent_volume_claim.side_effect = (
+        lambda namespace, **kwargs: raw_list(pvcs.get(namespace, []))
+    )
+    core_v1.list_namespaced_pod.side_effect = lambda namespace, **kwargs: raw_list(pods.get(namespace, []))
+    core_v1.list_namespaced_resource_quota.side_effect = (
+        lambda namespace, **kwargs: raw_list([quota] if namespace == "runai-a" else [])
+    )
+    core_v1.list_resource_quota_for_all_namespaces.return_value = raw_list([quota])
+    return core_v1
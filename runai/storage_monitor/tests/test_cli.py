@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for CLI JSON and CSV output."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from runai_storage_monitor import cli as cli_module
+from runai_storage_monitor.core.analyzers.storage_analyzer import StorageAnalyzer
+
+
+@pytest.fixture
+def run_cli(monkeypatch, k8s_client, fake_cluster):
+    """Invoke the CLI against the fake cluster and return the result."""
+    analyzer = StorageAnalyzer.from_k8s_client(k8s_client)
+    monkeypatch.setattr(cli_module, "_get_analyzer", lambda kubeconfig, context: analyzer)
+    
+    def run(*args):
+        result = CliRunner().invoke(cli_module.cli, args, catch_exceptions=False)
+        assert result.exit_code == 0, result.output
+        return result.output
+    return run
+
+
+def test_analyze_json(run_cli):
+    output = run_cli("analyze", "runai-a", "--format", "json")
+    
+    progress, body = output.split("\n", 1)
+    assert progress == "Analyzing storage for namespace: runai-a..."
+    analysis = json.loads(body)
+    assert analysis["namespace"] == "runai-a"
+    assert analysis["summary"]["total_pvcs"] == 2
+    assert analysis["summary"]["unused_pvcs"] == 1
+    assert analysis["summary"]["total_capacity_gi"] == 30.0
+    assert analysis["summary"]["unused_capacity_gi"] == 20.0
+    assert analysis["summary"]["has_quota"] is True
+    assert {pvc["pvc"]["name"]: pvc["is_unused"] for pvc in analysis["pvcs"]} == {
+        "data-a": False,
+        "scratch-a": True,
+    }
+
+
+def test_dashboard_summaries_json(run_cli, fake_cluster):
+    summaries = json.loads(run_cli("dashboard", "summaries", "--format", "json"))
+    
+    assert [s["namespace"] for s in summaries] == ["runai-a", "runai-b"]
+    assert summaries[0]["total_capacity_gi"] == 30.0
+    assert summaries[0]["has_quota"] is True
+    assert summaries[1]["unused_capacity_gi"] == 1024.0
+    assert summaries[1]["has_quota"] is False
+    assert all(s["error"] is None for s in summaries)
+    # Quotas of all namespaces come from one cluster-wide list
+    fake_cluster.list_resource_quota_for_all_namespaces.assert_called_once()
+    fake_cluster.list_namespaced_resource_quota.assert_not_called()
+
+
+def test_dashboard_summaries_csv(run_cli):
+    output = run_cli("dashboard", "summaries", "--format", "csv")
+    
+    assert output.splitlines() == [
+        "namespace,total_pvcs,unused_pvcs,total_capacity_gi,unused_capacity_gi,has_quota,error",
+        "runai-a,2,1,30.00,20.00,True,",
+        "runai-b,1,1,1024.00,1024.00,False,",
+    ]
+
+
+def test_export_csv(run_cli, tmp_path):
+    output_file = tmp_path / "runai-a.csv"
+    
+    run_cli("export", "runai-a", str(output_file), "--format", "csv")
+    
+    header, *rows = output_file.read_text().splitlines()
+    assert header == "Name,Status,Capacity,Storage Class,Pods,Unused,Age (days)"
+    assert [row.rsplit(",", 1)[0] for row in rows] == [
+        "data-a,Bound,10Gi,standard,1,No",
+        "scratch-a,Bound,20Gi,standard,0,Yes",
+    ]
+    assert all(row.rsplit(",", 1)[1].isdigit() for row in rows)
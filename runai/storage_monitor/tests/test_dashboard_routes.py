@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the NDJSON namespace summaries stream endpoint."""
+
+import json
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.testclient import TestClient
+from kubernetes.client.rest import ApiException
+
+from runai_storage_monitor.api import dashboard_routes
+from runai_storage_monitor.core.analyzers.storage_analyzer import StorageAnalyzer
+from runai_storage_monitor.core.logging_manager import StructuredLogger
+from runai_storage_monitor.core.services.dashboard_aggregator import DashboardAggregator
+
+
+STREAM_URL = "/dashboard/namespaces/summaries/stream"
+
+
+@pytest.fixture
+def api(monkeypatch, tmp_path, k8s_client, fake_cluster):
+    """Test client for the dashboard routes, aggregating the fake cluster."""
+    structured_logger = StructuredLogger()
+    structured_logger.log_file = tmp_path / "operations.jsonl"
+    monkeypatch.setattr(dashboard_routes, "logger", structured_logger)
+    monkeypatch.setattr(
+        dashboard_routes, "_aggregator", DashboardAggregator(StorageAnalyzer.from_k8s_client(k8s_client))
+    )
+    
+    app = FastAPI()
+    # As in the server; the stream must bypass it
+    app.add_middleware(GZipMiddleware, minimum_size=1)
+    app.include_router(dashboard_routes.dashboard_router)
+    with TestClient(app) as test_client:
+        yield test_client
+    
+    dashboard_routes.close_aggregator()
+    structured_logger.close()
+
+
+def _stream_lines(api, params=None):
+    response = api.get(STREAM_URL, params=params, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-encoding"] == "identity"
+    assert response.text.endswith("\n")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_streams_one_summary_per_line(api):
+    # Lines arrive in completion order
+    summaries = sorted(_stream_lines(api), key=lambda s: s["namespace"])
+    
+    assert [s["namespace"] for s in summaries] == ["runai-a", "runai-b"]
+    assert summaries[0]["total_pvcs"] == 2
+    assert summaries[0]["unused_capacity_gi"] == 20.0
+    assert summaries[0]["has_quota"] is True
+    assert summaries[1]["total_capacity_gi"] == 1024.0
+    # None fields are omitted
+    assert all("error" not in s for s in summaries)
+
+
+def test_namespace_filter(api):
+    summaries = _stream_lines(api, {"namespaces": ["runai-b"]})
+    
+    assert [s["namespace"] for s in summaries] == ["runai-b"]
+
+
+def test_failed_namespace_streams_error(api, fake_cluster):
+    list_pvcs = fake_cluster.list_namespaced_persistent_volume_claim.side_effect
+    
+    def list_pvcs_or_fail(namespace, **kwargs):
+        if namespace == "runai-b":
+            raise ApiException(status=403, reason="Forbidden")
+        return list_pvcs(namespace, **kwargs)
+    
+    fake_cluster.list_namespaced_persistent_volume_claim.side_effect = list_pvcs_or_fail
+    
+    summaries = {s["namespace"]: s for s in _stream_lines(api)}
+    
+    assert "error" not in summaries["runai-a"]
+    assert "Forbidden" in summaries["runai-b"]["error"]
+
+
+def test_namespaces_listed_off_the_event_loop(api, fake_cluster):
+    namespaces = fake_cluster.list_namespace.return_value
+    threads = []
+    
+    def record_thread(**kwargs):
+        threads.append(threading.current_thread().name)
+        return namespaces
+    
+    fake_cluster.list_namespace.side_effect = record_thread
+    
+    assert len(_stream_lines(api)) == 2
+    assert len(threads) == 1 and threads[0].startswith("dash-agg")
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for K8sClient reads served from the reflector caches."""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+from kubernetes import client
+
+from runai_storage_monitor.core.clients import reflector_cache
+
+
+class IdleWatch:
+    """Watch stand-in whose stream delivers no events until stopped."""
+    
+    def __init__(self):
+        self._stopped = threading.Event()
+    
+    def stream(self, *args, **kwargs):
+        self._stopped.wait()
+        yield from ()
+    
+    def stop(self):
+        self._stopped.set()
+
+
+@pytest.fixture
+def cached_client(monkeypatch, k8s_client):
+    """K8sClient with use_cache=True mirroring only runai- namespaces."""
+    monkeypatch.setattr(reflector_cache, "watch", SimpleNamespace(Watch=IdleWatch))
+    k8s_client.use_cache = True
+    k8s_client.cache_namespace_prefix = "runai-"
+    yield k8s_client
+    k8s_client.close()
+
+
+def _pod(name, namespace, claim_name):
+    return client.V1Pod(
+        metadata=client.V1ObjectMeta(name=name, namespace=namespace, uid=f"uid-{name}"),
+        spec=client.V1PodSpec(containers=[], node_name="node-1", volumes=[
+            client.V1Volume(
+                name="data",
+                persistent_volume_claim=client.V1PersistentVolumeClaimVolumeSource(claim_name=claim_name)
+            )
+        ]),
+        status=client.V1PodStatus(phase="Running")
+    )
+
+
+def test_cache_stores_projected_dicts_of_mirrored_namespaces(cached_client, core_v1):
+    core_v1.list_pod_for_all_namespaces.return_value = client.V1PodList(
+        items=[_pod("train-a", "runai-a", "data-a"), _pod("web", "default", "www")],
+        metadata=client.V1ListMeta(resource_version="10")
+    )
+    
+    pods = cached_client.list_pods("runai-a")
+    
+    assert [(pod["name"], pod["pvc_claims"]) for pod in pods] == [("train-a", ["data-a"])]
+    cache = cached_client._caches[("pods", None, None)]
+    assert all(isinstance(pod, dict) for pod in cache.list())
+    assert [pod["namespace"] for pod in cache.list()] == ["runai-a"]
+    # A second namespace is served by the same cluster-wide cache
+    assert cached_client.list_pods("runai-b") == []
+    core_v1.list_pod_for_all_namespaces.assert_called_once()
+    core_v1.list_namespaced_pod.assert_not_called()
+
+
+def test_other_namespaces_are_listed_from_the_api(cached_client, core_v1, raw_list):
+    core_v1.list_namespaced_pod.return_value = raw_list([{
+        "metadata": {"name": "web", "namespace": "default"},
+        "spec": {"volumes": [{"name": "data", "persistentVolumeClaim": {"claimName": "www"}}]},
+        "status": {"phase": "Running"},
+    }])
+    
+    pods = cached_client.list_pods("default")
+    
+    assert [(pod["name"], pod["pvc_claims"]) for pod in pods] == [("web", ["www"])]
+    assert not cached_client.serves_from_cache("default")
+    assert cached_client._caches == {}
+    core_v1.list_pod_for_all_namespaces.assert_not_called()
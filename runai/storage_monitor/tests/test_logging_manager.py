@@ -0,0 +1,124 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for StructuredLogger log file writing and get_logs_since."""
+
+import json
+import time
+from datetime import datetime
+
+import pytest
+
+from runai_storage_monitor.core import logging_manager
+from runai_storage_monitor.core.logging_manager import StructuredLogger
+
+
+# Entries are stamped one second apart starting at this epoch time
+BASE_NS = 1_700_000_000 * 10**9
+STEP_NS = 10**9
+
+
+@pytest.fixture
+def structured_logger(monkeypatch, tmp_path):
+    """Logger writing to a temporary file whose entries get scripted timestamps."""
+    timestamps = (BASE_NS + i * STEP_NS for i in range(1000))
+    monkeypatch.setattr(logging_manager.time, "time_ns", lambda: next(timestamps))
+    
+    structured_logger = StructuredLogger(max_entries=5)
+    structured_logger.log_file = tmp_path / "operations.jsonl"
+    yield structured_logger
+    structured_logger.close()
+
+
+def _since(ns):
+    return datetime.fromtimestamp(ns / 1e9)
+
+
+def _log(structured_logger, count):
+    for i in range(count):
+        structured_logger.log_operation(f"op{i}", "CORE")
+
+
+@pytest.mark.parametrize("since_ns, expected", [
+    (BASE_NS - STEP_NS, ["op0", "op1", "op2", "op3"]),
+    (BASE_NS, ["op1", "op2", "op3"]),
+    (BASE_NS + STEP_NS // 2, ["op1", "op2", "op3"]),
+    (BASE_NS + 2 * STEP_NS, ["op3"]),
+    (BASE_NS + 3 * STEP_NS, []),
+    (BASE_NS + 10 * STEP_NS, []),
+])
+def test_returns_entries_strictly_after_since(structured_logger, since_ns, expected):
+    _log(structured_logger, 4)
+    
+    entries = structured_logger.get_logs_since(_since(since_ns))
+    
+    assert [e["operation"] for e in entries] == expected
+
+
+def test_empty_buffer(structured_logger):
+    assert structured_logger.get_logs_since(_since(BASE_NS)) == []
+
+
+def test_after_buffer_wraps(structured_logger):
+    # max_entries=5 drops op0..op2
+    _log(structured_logger, 8)
+    
+    entries = structured_logger.get_logs_since(_since(BASE_NS + 5 * STEP_NS))
+    
+    assert [e["operation"] for e in entries] == ["op6", "op7"]
+    assert [e["operation"] for e in structured_logger.get_logs_since(_since(0))] == [
+        "op3", "op4", "op5", "op6", "op7"
+    ]
+
+
+def test_entries_have_public_shape(structured_logger):
+    _log(structured_logger, 1)
+    
+    entry, = structured_logger.get_logs_since(_since(BASE_NS - STEP_NS))
+    
+    assert "ts_ns" not in entry
+    assert entry["timestamp"] == _since(BASE_NS).isoformat()
+
+
+def test_unserializable_entry_does_not_stop_writer(structured_logger):
+    structured_logger.log_operation("int_keys", "API", details={1: "a"})
+    structured_logger.log_operation("tuple_keys", "API", details={(1, 2): "b"})
+    # Let the writer take the bad entry before logging more
+    deadline = time.monotonic() + 5
+    while not structured_logger._write_queue.empty() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    structured_logger.log_operation("after", "API")
+    structured_logger.close()
+    
+    lines = [json.loads(line) for line in structured_logger.log_file.read_text().splitlines()]
+    assert [(e["operation"], e["details"]) for e in lines] == [("int_keys", {"1": "a"}), ("after", {})]
+    assert structured_logger.dropped_entries == 1
+
+
+def test_public_timestamp_round_trip(monkeypatch, structured_logger):
+    # Sub-microsecond parts that float conversion would round
+    timestamps = iter([BASE_NS + 123_456_789, BASE_NS + 123_456_999, BASE_NS + 123_457_001, BASE_NS + 999_999_999])
+    monkeypatch.setattr(logging_manager.time, "time_ns", lambda: next(timestamps))
+    _log(structured_logger, 4)
+    
+    entries = structured_logger.get_logs_since(_since(0))
+    assert [e["timestamp"][-7:] for e in entries] == [".123456", ".123456", ".123457", ".999999"]
+    
+    for i, entry in enumerate(entries):
+        later = structured_logger.get_logs_since(datetime.fromisoformat(entry["timestamp"]))
+        # Entries sharing the published microsecond are indistinguishable
+        expected = [e["operation"] for e in entries if e["timestamp"] > entry["timestamp"]]
+        assert [e["operation"] for e in later] == expected
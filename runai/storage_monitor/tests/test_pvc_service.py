@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for capacity string parsing."""
+
+import pytest
+
+from runai_storage_monitor.core.services.pvc_service import PVCService, _parse_capacity_to_gi
+
+
+@pytest.mark.parametrize("capacity, expected", [
+    ("2Ti", 2048.0),
+    ("100Gi", 100.0),
+    ("512Mi", 0.5),
+    ("1048576Ki", 1.0),
+    ("1.5Ti", 1536.0),
+    (" 10Gi ", 10.0),
+    # No suffix: bytes
+    ("1073741824", 1.0),
+    ("0", 0.0),
+])
+def test_units(capacity, expected):
+    assert _parse_capacity_to_gi(capacity) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("capacity", ["", None, "Unknown"])
+def test_missing_capacity_is_zero(capacity):
+    assert _parse_capacity_to_gi(capacity) == 0.0
+
+
+@pytest.mark.parametrize("capacity", ["10G", "10GB", "abc"])
+def test_unsupported_units_raise(capacity):
+    with pytest.raises(ValueError):
+        _parse_capacity_to_gi(capacity)
+
+
+def test_service_exposes_parser():
+    assert PVCService.parse_capacity_to_gi("1Ti") == 1024.0
@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for QuotaService storage and full quota views."""
+
+import pytest
+
+from runai_storage_monitor.core.services.quota_service import QuotaService
+
+
+def _raw_quota(name, hard, used=None, resource_version="1"):
+    """Build a raw ResourceQuota object as returned by the API."""
+    return {
+        "metadata": {"name": name, "namespace": "runai-a", "resourceVersion": resource_version},
+        "status": {"hard": hard, "used": used or {}},
+    }
+
+
+@pytest.fixture
+def quota_service(k8s_client):
+    return QuotaService(k8s_client)
+
+
+def test_storage_quota_keeps_only_storage_keys(quota_service, core_v1, raw_list):
+    core_v1.list_namespaced_resource_quota.return_value = raw_list([
+        _raw_quota(
+            "project-quota",
+            {"requests.storage": "100Gi", "persistentvolumeclaims": "10", "requests.cpu": "8", "nvidia.com/gpu": "4"},
+            {"requests.storage": "40Gi", "persistentvolumeclaims": "3", "requests.cpu": "2"},
+        ),
+    ])
+    
+    quota = quota_service.get_storage_quota("runai-a")
+    
+    assert quota.name == "project-quota"
+    assert quota.hard_limits == {"requests.storage": "100Gi", "persistentvolumeclaims": "10"}
+    assert quota.used == {"requests.storage": "40Gi", "persistentvolumeclaims": "3"}
+    assert quota.has_storage_quota
+    assert quota.storage_limit == "100Gi"
+    assert quota.storage_used == "40Gi"
+    assert quota.pvc_count_limit == 10
+    assert quota.pvc_count_used == 3
+
+
+def test_full_quota_keeps_all_keys(quota_service, core_v1, raw_list):
+    hard = {"requests.storage": "100Gi", "requests.cpu": "8", "nvidia.com/gpu": "4"}
+    core_v1.list_namespaced_resource_quota.return_value = raw_list([_raw_quota("project-quota", hard)])
+    
+    quota = quota_service.get_full_quota("runai-a")
+    
+    assert quota.hard_limits == hard
+    assert quota.has_storage_quota
+    assert quota.storage_limit == "100Gi"
+
+
+def test_no_storage_keys(quota_service, core_v1, raw_list):
+    hard = {"requests.cpu": "8", "nvidia.com/gpu": "4"}
+    core_v1.list_namespaced_resource_quota.return_value = raw_list([_raw_quota("compute-quota", hard)])
+    
+    assert quota_service.get_storage_quota("runai-a") is None
+    
+    full_quota = quota_service.get_full_quota("runai-a")
+    assert full_quota.hard_limits == hard
+    assert not full_quota.has_storage_quota
+    assert full_quota.storage_limit is None
+
+
+def test_no_quotas(quota_service, core_v1, raw_list):
+    core_v1.list_namespaced_resource_quota.return_value = raw_list([])
+    
+    assert quota_service.get_storage_quota("runai-a") is None
+    assert quota_service.get_full_quota("runai-a") is None
+
+
+def test_storage_limits_combined_across_quotas(quota_service, core_v1, raw_list):
+    core_v1.list_namespaced_resource_quota.return_value = raw_list([
+        _raw_quota("compute-quota", {"requests.cpu": "8"}),
+        _raw_quota("storage-quota", {"requests.storage": "100Gi"}),
+        _raw_quota("pvc-quota", {"persistentvolumeclaims": "10"}),
+    ])
+    
+    quota = quota_service.get_storage_quota("runai-a")
+    
+    # Named after the first quota that bounds storage
+    assert quota.name == "storage-quota"
+    assert quota.hard_limits == {"requests.storage": "100Gi", "persistentvolumeclaims": "10"}
@@ -0,0 +1,187 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the ReflectorCache list/watch/relist logic."""
+
+from types import SimpleNamespace
+
+import pytest
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+
+from runai_storage_monitor.core.clients import reflector_cache
+from runai_storage_monitor.core.clients.reflector_cache import ReflectorCache
+
+
+def _pod(name, namespace, uid, resource_version="1"):
+    metadata = client.V1ObjectMeta(name=name, namespace=namespace, uid=uid, resource_version=resource_version)
+    return client.V1Pod(metadata=metadata)
+
+
+def _pod_list(resource_version, *pods):
+    return client.V1PodList(items=list(pods), metadata=client.V1ListMeta(resource_version=resource_version))
+
+
+class FakeWatch:
+    """Stand-in for kubernetes.watch.Watch that replays scripted steps.
+    
+    Each stream() call consumes one step: a list of (type, object) events to
+    yield, or an exception to raise. Once the steps run out the cache is
+    stopped so ReflectorCache._run returns.
+    """
+    
+    def __init__(self, cache, steps, resource_versions):
+        self.cache = cache
+        self.steps = steps
+        self.resource_versions = resource_versions
+    
+    def stream(self, func, *args, **kwargs):
+        self.resource_versions.append(kwargs["resource_version"])
+        if not self.steps:
+            self.cache.stop()
+            return
+        step = self.steps.pop(0)
+        if isinstance(step, Exception):
+            raise step
+        for event_type, obj in step:
+            yield {"type": event_type, "object": obj}
+    
+    def stop(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(reflector_cache, "WATCH_RETRY_DELAY_SECONDS", 0)
+
+
+def _run(monkeypatch, cache, steps):
+    """Start the cache and wait until its watch loop has replayed the steps.
+    
+    Returns:
+        resourceVersions the successive watches were opened from
+    """
+    resource_versions = []
+    monkeypatch.setattr(
+        reflector_cache, "watch",
+        SimpleNamespace(Watch=lambda: FakeWatch(cache, steps, resource_versions))
+    )
+    cache.start()
+    cache._thread.join(timeout=5)
+    assert not cache._thread.is_alive()
+    return resource_versions
+
+
+def test_list_indexes_by_namespace(monkeypatch, core_v1):
+    core_v1.list_pod_for_all_namespaces.return_value = _pod_list(
+        "10", _pod("a1", "a", "u1"), _pod("a2", "a", "u2"), _pod("b1", "b", "u3")
+    )
+    cache = ReflectorCache(core_v1.list_pod_for_all_namespaces, label_selector="app=x")
+    _run(monkeypatch, cache, [])
+    
+    assert {pod.metadata.name for pod in cache.list()} == {"a1", "a2", "b1"}
+    assert {pod.metadata.name for pod in cache.list("a")} == {"a1", "a2"}
+    assert cache.list("missing") == []
+    
+    # Listed once, from the API server watch cache, with the caller's kwargs
+    core_v1.list_pod_for_all_namespaces.assert_called_once_with(resource_version="0", label_selector="app=x")
+
+
+def test_watch_events_update_store(monkeypatch, core_v1):
+    core_v1.list_pod_for_all_namespaces.return_value = _pod_list(
+        "10", _pod("a1", "a", "u1"), _pod("b1", "b", "u2")
+    )
+    cache = ReflectorCache(core_v1.list_pod_for_all_namespaces)
+    bookmark = client.V1Pod(metadata=client.V1ObjectMeta(resource_version="14"))
+    
+    resource_versions = _run(monkeypatch, cache, [[
+        ("ADDED", _pod("a2", "a", "u3", "11")),
+        ("MODIFIED", _pod("a1-renamed", "a", "u1", "12")),
+        ("DELETED", _pod("b1", "b", "u2", "13")),
+        ("BOOKMARK", bookmark),
+    ]])
+    
+    assert {pod.metadata.name for pod in cache.list("a")} == {"a1-renamed", "a2"}
+    assert cache.list("b") == []
+    assert "b" not in cache._by_namespace
+    # The next watch resumes from the last event, including bookmarks
+    assert resource_versions == ["10", "14"]
+    assert core_v1.list_pod_for_all_namespaces.call_count == 1
+
+
+@pytest.mark.parametrize("error", [
+    ApiException(status=410, reason="Gone"),
+    ApiException(status=504, reason="Too large resource version: 30, current: 20"),
+])
+def test_unusable_resource_version_relists(monkeypatch, core_v1, error):
+    core_v1.list_pod_for_all_namespaces.side_effect = [
+        _pod_list("10", _pod("a1", "a", "u1")),
+        _pod_list("20", _pod("a2", "a", "u2")),
+    ]
+    cache = ReflectorCache(core_v1.list_pod_for_all_namespaces)
+    
+    resource_versions = _run(monkeypatch, cache, [error])
+    
+    assert [pod.metadata.name for pod in cache.list("a")] == ["a2"]
+    assert resource_versions == ["10", "20"]
+
+
+def test_other_watch_errors_resume_without_relist(monkeypatch, core_v1):
+    core_v1.list_pod_for_all_namespaces.return_value = _pod_list("10", _pod("a1", "a", "u1"))
+    cache = ReflectorCache(core_v1.list_pod_for_all_namespaces)
+    
+    resource_versions = _run(monkeypatch, cache, [
+        ApiException(status=500, reason="Internal Server Error"),
+        ApiException(status=504, reason="Gateway Timeout"),
+    ])
+    
+    assert resource_versions == ["10", "10", "10"]
+    assert core_v1.list_pod_for_all_namespaces.call_count == 1
+
+
+@pytest.mark.parametrize("status, reason, body, expected", [
+    (410, "Gone", None, True),
+    (504, "Too large resource version", None, True),
+    (504, None, '{"reason": "ResourceVersionTooLarge"}', True),
+    (504, "Gateway Timeout", None, False),
+    (500, "Too large resource version", None, False),
+])
+def test_needs_relist(status, reason, body, expected):
+    error = ApiException(status=status, reason=reason)
+    error.body = body
+    
+    assert reflector_cache._needs_relist(error) is expected
+
+
+def test_project_and_namespace_filter(monkeypatch, core_v1):
+    core_v1.list_pod_for_all_namespaces.return_value = _pod_list(
+        "10", _pod("a1", "runai-a", "u1"), _pod("d1", "default", "u2")
+    )
+    cache = ReflectorCache(
+        core_v1.list_pod_for_all_namespaces,
+        project=lambda pod: {"name": pod.metadata.name},
+        namespace_filter=lambda namespace: namespace.startswith("runai-")
+    )
+    
+    _run(monkeypatch, cache, [[
+        ("ADDED", _pod("d2", "default", "u3", "11")),
+        ("ADDED", _pod("a2", "runai-a", "u4", "12")),
+        ("DELETED", _pod("a1", "runai-a", "u1", "13")),
+    ]])
+    
+    # Only projected values of matching namespaces are stored
+    assert cache.list() == [{"name": "a2"}]
+    assert cache.list("default") == []
@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for StorageAnalyzer.analyze_namespace."""
+
+import threading
+
+from runai_storage_monitor.core.analyzers.storage_analyzer import StorageAnalyzer
+
+
+def test_analyze_namespace(k8s_client, fake_cluster):
+    analysis = StorageAnalyzer.from_k8s_client(k8s_client).analyze_namespace("runai-a")
+    
+    assert analysis.summary.total_pvcs == 2
+    assert analysis.summary.unused_pvcs == 1
+    assert analysis.summary.total_capacity_gi == 30.0
+    assert analysis.summary.has_quota
+    # One list call per resource
+    fake_cluster.list_namespaced_persistent_volume_claim.assert_called_once()
+    fake_cluster.list_namespaced_pod.assert_called_once()
+    fake_cluster.list_namespaced_resource_quota.assert_called_once()
+
+
+def test_concurrent_reads_reuse_client_pool(k8s_client, fake_cluster):
+    list_pods = fake_cluster.list_namespaced_pod.side_effect
+    threads = set()
+    
+    def record_thread(namespace, **kwargs):
+        threads.add(threading.current_thread().name)
+        return list_pods(namespace, **kwargs)
+    
+    fake_cluster.list_namespaced_pod.side_effect = record_thread
+    analyzer = StorageAnalyzer.from_k8s_client(k8s_client)
+    
+    for _ in range(5):
+        analyzer.analyze_namespace("runai-a")
+        analyzer.analyze_namespace("runai-b", quotas=[])
+    
+    # Pods are listed on the client's long-lived pool, not per-call executors
+    assert threads and all(name.startswith("k8s-read") for name in threads)
+    executor = k8s_client._executor
+    
+    k8s_client.close()
+    assert k8s_client._executor is None
+    assert executor._shutdown
+
+
+def test_cached_client_reads_inline(k8s_client, fake_cluster):
+    k8s_client.use_cache = True
+    k8s_client.list_pvcs = lambda namespace: []
+    k8s_client.list_pods = lambda namespace: []
+    k8s_client.list_resource_quotas = lambda namespace: []
+    k8s_client.list_storage_classes = lambda: []
+    
+    analysis = StorageAnalyzer.from_k8s_client(k8s_client).analyze_namespace("runai-a")
+    
+    assert analysis.summary.total_pvcs == 0
+    assert k8s_client._executor is None